@@ -1,19 +1,47 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = ["pypdf"]
+# dependencies = ["pillow", "pypdf", "pypdfium2"]
 # ///
 
 import argparse
+import os
 import re
 import shutil
+import string
 import subprocess
 import sys
+import tempfile
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 
+import pypdfium2 as pdfium
 from pypdf import PdfReader
 
+# Upper bound on concurrent render/OCR workers. Without a container CPU
+# limit os.cpu_count() reports every host core.
+MAX_WORKERS = 8
+# Decoded page bitmaps waiting to be encoded (~11 MB each at 200 DPI).
+MAX_PENDING_PAGES = 4
+
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg"}
+# Pages that needed OCR are scans; JPEG at 150 DPI encodes far faster than
+# PNG at 200 DPI and is still plenty for LLM viewing.
+TEXT_RENDER_DEFAULTS = ("png", 200)
+SCAN_RENDER_DEFAULTS = ("jpeg", 150)
+# Title OCR always reads a lossless page at least this sharp.
+TITLE_OCR_DPI = 200
+
+_FSCHARS = re.compile(r"[\\/:*?\"<>|]")
+_DASHRUN = re.compile(r"-+")
+
+# Deletion tables for counting character classes with C-level translate().
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+_CJK_DELETE = dict.fromkeys(range(0x4E00, 0xA000))
+
 TITLE_BLACKLIST = {
     "confidential",
     "disclaimer",
@@ -26,22 +54,39 @@ TITLE_BLACKLIST = {
     "保密",
     "版权",
 }
+_TITLE_BLACKLIST_RE = re.compile(
+    "|".join(sorted(map(re.escape, TITLE_BLACKLIST), key=len, reverse=True))
+)
 
 
+_TOOL_PATHS: dict[str, str] = {}
+
+
+@lru_cache(maxsize=1)
 def require_tools() -> None:
     required = ["ocrmypdf", "tesseract", "pdftoppm"]
-    missing = [tool for tool in required if shutil.which(tool) is None]
+    missing = []
+    for tool in required:
+        resolved = shutil.which(tool)
+        if resolved is None:
+            missing.append(tool)
+        else:
+            _TOOL_PATHS[tool] = resolved
     if missing:
         print("Missing required tools: " + ", ".join(missing))
         print("Install with: brew install ocrmypdf tesseract poppler")
         sys.exit(1)
 
 
+def tool_path(tool: str) -> str:
+    # Absolute paths resolved by require_tools() skip the PATH search on exec.
+    return _TOOL_PATHS.get(tool, tool)
+
+
 def sanitize_name(name: str) -> str:
-    name = re.sub(r"[\s\u00a0]+", " ", name.strip())
-    name = re.sub(r"[\\/:*?\"<>|]", "", name)
-    name = re.sub(r"[\s]+", "-", name)
-    name = re.sub(r"-+", "-", name)
+    # str.split() collapses every Unicode whitespace run (incl. NBSP) in C.
+    name = "-".join(_FSCHARS.sub("", name).split())
+    name = _DASHRUN.sub("-", name)
     return name.strip("-")
 
 
@@ -55,15 +100,67 @@ def ensure_unique_dir(base_dir: Path) -> Path:
     raise RuntimeError("Too many duplicate directories")
 
 
-def read_pdf_title(pdf_path: Path) -> Optional[str]:
+PdfDocument = Union[pdfium.PdfDocument, PdfReader]
+
+
+def open_pdf(pdf_path: Path) -> PdfDocument:
+    return _open_pdf_cached(str(pdf_path))
+
+
+@lru_cache(maxsize=4)
+def _open_pdf_cached(path_str: str) -> PdfDocument:
+    # One parse per path shared by title, text-detection and text passes.
+    # pdfium extracts text in C++; pypdf is kept for files pdfium rejects.
     try:
-        reader = PdfReader(str(pdf_path))
-    except Exception:
-        return None
-    meta = reader.metadata or {}
+        return pdfium.PdfDocument(path_str)
+    except pdfium.PdfiumError:
+        return PdfReader(path_str)
+
+
+def pdf_document_page_count(pdf: PdfDocument) -> int:
+    if isinstance(pdf, PdfReader):
+        return len(pdf.pages)
+    return len(pdf)
+
+
+def pdf_page_text(pdf: PdfDocument, index: int) -> str:
+    if isinstance(pdf, PdfReader):
+        return pdf.pages[index].extract_text() or ""
+    return pdf[index].get_textpage().get_text_range()
+
+
+def pdf_metadata_title(pdf: PdfDocument) -> Optional[str]:
+    if not isinstance(pdf, PdfReader):
+        return pdf.get_metadata_dict().get("Title")
+    meta = pdf.metadata or {}
     title = getattr(meta, "title", None) if not isinstance(meta, dict) else None
     if not title and isinstance(meta, dict):
         title = meta.get("/Title")
+    return title
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    # A hardlink shares the inode, so no bytes are copied and both names move
+    # together when the output directory is renamed. The relative symlink
+    # covers filesystems without hardlinks; copying is the last resort.
+    try:
+        os.link(source, target)
+        return
+    except OSError:
+        pass
+    try:
+        target.symlink_to(os.path.relpath(source, target.parent))
+        return
+    except OSError:
+        pass
+    shutil.copy2(source, target)
+
+
+def read_pdf_title(pdf_path: Path) -> Optional[str]:
+    try:
+        title = pdf_metadata_title(open_pdf(pdf_path))
+    except Exception:
+        return None
     if not title:
         return None
     title = sanitize_name(str(title))
@@ -74,114 +171,297 @@ def read_pdf_title(pdf_path: Path) -> Optional[str]:
 
 def pdf_has_text(pdf_path: Path) -> bool:
     try:
-        reader = PdfReader(str(pdf_path))
+        pdf = open_pdf(pdf_path)
     except Exception:
         return False
-    total_pages = len(reader.pages)
+    total_pages = pdf_document_page_count(pdf)
     if total_pages == 0:
         return False
+    # A deck has text if >= 30% of pages carry 20+ chars or the average is
+    # 30+ chars per page. Both counters only grow, so stop once either holds.
+    min_text_pages = -(-3 * total_pages // 10)
+    min_total_chars = 30 * total_pages
     text_pages = 0
     total_chars = 0
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        text = text.strip()
+    for index in range(total_pages):
+        text = pdf_page_text(pdf, index).strip()
         total_chars += len(text)
         if len(text) >= 20:
             text_pages += 1
-    avg_chars = total_chars / total_pages
-    return text_pages / total_pages >= 0.3 or avg_chars >= 30
+        if text_pages >= min_text_pages or total_chars >= min_total_chars:
+            return True
+    return False
 
 
-def run_command(command: list[str]) -> None:
-    result = subprocess.run(command, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(result.stdout)
-        print(result.stderr, file=sys.stderr)
-        raise RuntimeError("Command failed: " + " ".join(command))
+# subprocess only takes its posix_spawn() fast path (no fork of this
+# process) for an absolute executable with close_fds=False. Leaving fds open
+# is safe: Python creates file descriptors non-inheritable by default.
+SPAWN_OPTIONS = {"close_fds": False}
 
 
-def run_ocr(source_pdf: Path, target_pdf: Path, lang: str) -> None:
+def run_command(command: list[str]) -> None:
+    # Tool output is spooled to disk and only read back on failure, so large
+    # ocrmypdf/pdftoppm logs never accumulate in memory.
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        process = subprocess.Popen(command, stdout=out, stderr=err, **SPAWN_OPTIONS)
+        if process.wait() != 0:
+            out.seek(0)
+            err.seek(0)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(out.read())
+            sys.stdout.buffer.flush()
+            sys.stderr.flush()
+            sys.stderr.buffer.write(err.read())
+            sys.stderr.buffer.flush()
+            raise RuntimeError("Command failed: " + " ".join(command))
+
+
+def run_ocr(
+    source_pdf: Path, target_pdf: Path, lang: str, jobs: Optional[int] = None
+) -> None:
     command = [
-        "ocrmypdf",
+        tool_path("ocrmypdf"),
         "--language",
         lang,
         "--skip-text",
         "--rotate-pages",
         "--deskew",
-        str(source_pdf),
-        str(target_pdf),
     ]
-    run_command(command)
+    if jobs is not None:
+        command += ["--jobs", str(jobs)]
+    run_command(command + [str(source_pdf), str(target_pdf)])
+
+
+def pdf_page_count(pdf_path: Path) -> int:
+    try:
+        return pdf_document_page_count(open_pdf(pdf_path))
+    except Exception:
+        return 0
+
+
+def _worker_count() -> int:
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is Linux-only.
+        available = os.cpu_count() or 1
+    return max(1, min(available, MAX_WORKERS))
+
+
+def split_page_range(total_pages: int, workers: int) -> list[tuple[int, int]]:
+    # Contiguous 1-based (first, last) ranges, one per worker.
+    workers = max(1, min(workers, total_pages))
+    return [
+        (i * total_pages // workers + 1, (i + 1) * total_pages // workers)
+        for i in range(workers)
+    ]
 
 
-def extract_images(pdf_path: Path, pages_dir: Path) -> list[Path]:
+def extract_images(
+    pdf_path: Path, pages_dir: Path, image_format: str = "png", dpi: int = 200
+) -> list[Path]:
     pages_dir.mkdir(parents=True, exist_ok=True)
     prefix = pages_dir / "page"
+    extension = IMAGE_EXTENSIONS[image_format]
     command = [
-        "pdftoppm",
-        "-png",
+        tool_path("pdftoppm"),
+        f"-{image_format}",
         "-r",
-        "200",
-        str(pdf_path),
-        str(prefix),
+        str(dpi),
     ]
-    run_command(command)
-    generated = sorted(pages_dir.glob("page-*.png"))
+    if image_format == "jpeg":
+        command += ["-jpegopt", "quality=85"]
+    total_pages = pdf_page_count(pdf_path)
+    if total_pages > 1:
+        # pdftoppm is single-threaded; render page ranges in parallel.
+        # Output names carry the absolute page number, so ranges never collide.
+        ranges = split_page_range(total_pages, _worker_count())
+        commands = [
+            command + ["-f", str(first), "-l", str(last), str(pdf_path), str(prefix)]
+            for first, last in ranges
+        ]
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            list(executor.map(run_command, commands))
+    else:
+        run_command(command + [str(pdf_path), str(prefix)])
+    # Sort on the integer page number rather than the name: pdftoppm's zero
+    # padding is only an implementation detail of how the ranges were split.
+    prefix_len = len("page-")
+    with os.scandir(pages_dir) as entries:
+        generated = [
+            (int(entry.name[prefix_len : -len(extension)]), entry.path)
+            for entry in entries
+            if entry.name.startswith("page-")
+            and entry.name.endswith(extension)
+            and entry.name[prefix_len : -len(extension)].isdigit()
+        ]
+    generated.sort()
+    pages_root = str(pages_dir)
     renamed = []
-    for index, path in enumerate(generated, start=1):
-        new_name = pages_dir / f"{index:03d}.png"
-        path.rename(new_name)
-        renamed.append(new_name)
+    for index, (_, path) in enumerate(generated, start=1):
+        new_name = os.path.join(pages_root, f"{index:03d}{extension}")
+        os.rename(path, new_name)
+        renamed.append(Path(new_name))
     return renamed
 
 
 def extract_text_by_page(pdf_path: Path) -> list[str]:
-    reader = PdfReader(str(pdf_path))
+    pdf = open_pdf(pdf_path)
     texts = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        text = re.sub(r"\s+", " ", text).strip()
-        texts.append(text)
+    for index in range(pdf_document_page_count(pdf)):
+        texts.append(normalize_page_text(pdf_page_text(pdf, index)))
     return texts
 
 
-def ocr_image_text(image_path: Path, lang: str) -> str:
+def normalize_page_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def render_and_extract(
+    pdf_path: Path,
+    pages_dir: Path,
+    image_format: str = "png",
+    dpi: int = 200,
+    on_page_saved: Optional[Callable[[int, Path], None]] = None,
+) -> tuple[list[Path], list[str]]:
+    # on_page_saved(page_number, image_path) fires as soon as each image is
+    # on disk, so downstream work (e.g. title OCR) overlaps with rendering.
+    pdf = open_pdf(pdf_path)
+    if isinstance(pdf, PdfReader):
+        # pdfium could not open the file; render out-of-process instead.
+        images = extract_images(pdf_path, pages_dir, image_format, dpi)
+        if on_page_saved:
+            for index, image_path in enumerate(images, start=1):
+                on_page_saved(index, image_path)
+        return images, extract_text_by_page(pdf_path)
+
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    extension = IMAGE_EXTENSIONS[image_format]
+    save_options = {"quality": 85} if image_format == "jpeg" else {}
+    workers = min(_worker_count(), MAX_PENDING_PAGES)
+    images: list[Path] = []
+    texts: list[str] = []
+    # One pass over the document yields both the bitmap and the text of each
+    # page. pdfium is not thread-safe, so rendering stays on this thread; the
+    # PNG/JPEG encoding runs in the pool (Pillow releases the GIL), with at
+    # most MAX_PENDING_PAGES bitmaps in flight to bound memory.
+    def save_page(image, image_path: Path, page_number: int) -> None:
+        image.save(image_path, **save_options)
+        if on_page_saved:
+            on_page_saved(page_number, image_path)
+
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            image = page.render(scale=dpi / 72).to_pil()
+            texts.append(normalize_page_text(page.get_textpage().get_text_range()))
+            image_path = pages_dir / f"{index + 1:03d}{extension}"
+            pending.append(executor.submit(save_page, image, image_path, index + 1))
+            images.append(image_path)
+            if len(pending) >= MAX_PENDING_PAGES:
+                pending.popleft().result()
+        while pending:
+            pending.popleft().result()
+    return images, texts
+
+
+def ocr_images_text(image_paths: list[Path], lang: str) -> list[str]:
+    if not image_paths:
+        return []
+    if len(image_paths) == 1:
+        return ocr_image_batch(image_paths, lang)
+    # Tesseract's own OpenMP threading scales poorly; instead run several
+    # single-threaded processes (OMP_THREAD_LIMIT=1) over contiguous batches.
+    ranges = split_page_range(len(image_paths), _worker_count())
+    batches = [image_paths[first - 1 : last] for first, last in ranges]
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = executor.map(lambda batch: ocr_image_batch(batch, lang), batches)
+        return [text for texts in results for text in texts]
+
+
+def ocr_image_batch(image_paths: list[Path], lang: str) -> list[str]:
+    # A list file lets one tesseract process load the language models once
+    # and OCR every image; pages are separated by form feeds on stdout.
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", encoding="utf-8", delete=False
+    ) as handle:
+        handle.write("\n".join(str(path.resolve()) for path in image_paths) + "\n")
+        list_path = Path(handle.name)
     command = [
-        "tesseract",
-        str(image_path),
+        tool_path("tesseract"),
+        str(list_path),
         "stdout",
         "-l",
         lang,
         "--psm",
         "6",
     ]
-    result = subprocess.run(command, capture_output=True, text=True)
+    # Every spawned tesseract inherits this; parallelism comes from the
+    # concurrent batches in ocr_images_text, not from OpenMP.
+    env = {**os.environ, "OMP_THREAD_LIMIT": "1"}
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, env=env, **SPAWN_OPTIONS
+        )
+    finally:
+        list_path.unlink(missing_ok=True)
     if result.returncode != 0:
-        return ""
-    return result.stdout.strip()
+        return [""] * len(image_paths)
+    texts = [text.strip() for text in result.stdout.split("\x0c")]
+    texts = texts[: len(image_paths)]
+    return texts + [""] * (len(image_paths) - len(texts))
 
 
 def choose_title_from_lines(lines: List[str]) -> Optional[str]:
     best_line = None
     best_score = 0
     for line in lines:
-        cleaned = re.sub(r"\s+", " ", line).strip()
+        cleaned = " ".join(line.split())
         if len(cleaned) < 2:
             continue
         lowered = cleaned.lower()
-        if any(bad in lowered for bad in TITLE_BLACKLIST):
+        if _TITLE_BLACKLIST_RE.search(lowered):
             continue
-        cjk_count = len(re.findall(r"[\u4e00-\u9fff]", cleaned))
-        alpha_count = len(re.findall(r"[A-Za-z]", cleaned))
-        score = len(cleaned) + cjk_count * 4 + alpha_count * 2
+        length = len(cleaned)
+        cjk_count = length - len(cleaned.translate(_CJK_DELETE))
+        encoded = cleaned.encode("utf-8")
+        alpha_count = len(encoded) - len(encoded.translate(None, _ASCII_LETTERS))
+        score = length + cjk_count * 4 + alpha_count * 2
         if score > best_score:
             best_score = score
             best_line = cleaned
     return best_line
 
 
+def render_title_image(pdf_path: Path, image_path: Path) -> Optional[Path]:
+    # A dedicated PNG of page 1 for title OCR, for when the page images are
+    # JPEG or rendered below TITLE_OCR_DPI.
+    pdf = open_pdf(pdf_path)
+    if pdf_document_page_count(pdf) == 0:
+        return None
+    if isinstance(pdf, PdfReader):
+        command = [
+            tool_path("pdftoppm"),
+            "-png",
+            "-r",
+            str(TITLE_OCR_DPI),
+            "-f",
+            "1",
+            "-l",
+            "1",
+            "-singlefile",
+            str(pdf_path),
+            str(image_path.with_suffix("")),
+        ]
+        run_command(command)
+    else:
+        pdf[0].render(scale=TITLE_OCR_DPI / 72).to_pil().save(image_path)
+    return image_path
+
+
 def derive_title_from_first_page(image_path: Path, lang: str) -> Optional[str]:
-    text = ocr_image_text(image_path, lang)
+    text = ocr_images_text([image_path], lang)[0]
     if not text:
         return None
     lines = [line for line in text.splitlines() if line.strip()]
@@ -199,18 +479,19 @@ def derive_title_from_first_page(image_path: Path, lang: str) -> Optional[str]:
 def write_markdown(
     markdown_path: Path, page_texts: list[str], images: list[Path]
 ) -> None:
-    lines = []
-    for index, text in enumerate(page_texts, start=1):
-        lines.append(f"## Slide {index}")
-        if text:
-            lines.append(text)
-        else:
-            lines.append("(No text detected)")
-        if index - 1 < len(images):
-            image_rel = images[index - 1].relative_to(markdown_path.parent)
-            lines.append(f"![Slide {index}]({image_rel.as_posix()})")
-        lines.append("")
-    markdown_path.write_text("\n".join(lines), encoding="utf-8")
+    # Every page image lives in the same pages directory.
+    image_prefix = ""
+    if images:
+        image_prefix = images[0].parent.relative_to(markdown_path.parent).as_posix()
+    with markdown_path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+        for index, text in enumerate(page_texts, start=1):
+            if index > 1:
+                handle.write("\n")
+            handle.write(f"## Slide {index}\n")
+            handle.write(f"{text}\n" if text else "(No text detected)\n")
+            if index - 1 < len(images):
+                image_rel = f"{image_prefix}/{images[index - 1].name}"
+                handle.write(f"![Slide {index}]({image_rel})\n")
 
 
 def main() -> None:
@@ -220,6 +501,16 @@ def main() -> None:
         "--output", type=Path, default=Path("output"), help="Output directory"
     )
     parser.add_argument("--lang", default="chi_sim+eng", help="OCR language")
+    parser.add_argument(
+        "--render-format",
+        choices=sorted(IMAGE_EXTENSIONS),
+        help="Page image format (default: png, or jpeg when OCR was needed)",
+    )
+    parser.add_argument(
+        "--render-dpi",
+        type=int,
+        help="Page image DPI (default: 200, or 150 when OCR was needed)",
+    )
     args = parser.parse_args()
 
     require_tools()
@@ -240,21 +531,58 @@ def main() -> None:
     shutil.copy2(pdf_path, source_pdf)
 
     searchable_pdf = output_dir / "searchable.pdf"
-    if pdf_has_text(source_pdf):
-        shutil.copy2(source_pdf, searchable_pdf)
+    has_text = pdf_has_text(source_pdf)
+    if has_text:
+        link_or_copy(source_pdf, searchable_pdf)
     else:
-        run_ocr(source_pdf, searchable_pdf, args.lang)
+        run_ocr(source_pdf, searchable_pdf, args.lang, jobs=_worker_count())
 
+    default_format, default_dpi = (
+        TEXT_RENDER_DEFAULTS if has_text else SCAN_RENDER_DEFAULTS
+    )
+    image_format = args.render_format or default_format
+    dpi = args.render_dpi or default_dpi
     pages_dir = output_dir / "pages"
-    images = extract_images(searchable_pdf, pages_dir)
 
     title = read_pdf_title(source_pdf)
-    if not title and images:
-        title = derive_title_from_first_page(images[0], args.lang)
+    title_image = None
+    title_futures: list[Future] = []
+    with ThreadPoolExecutor(max_workers=1) as title_executor:
+        if not title and (image_format != "png" or dpi < TITLE_OCR_DPI):
+            title_image = render_title_image(searchable_pdf, output_dir / "title.png")
+            if title_image:
+                title_futures.append(
+                    title_executor.submit(
+                        derive_title_from_first_page, title_image, args.lang
+                    )
+                )
+
+        def on_page_saved(page_number: int, image_path: Path) -> None:
+            # Start first-page title OCR while later pages are still rendering.
+            if page_number == 1 and not title and not title_futures:
+                title_futures.append(
+                    title_executor.submit(
+                        derive_title_from_first_page, image_path, args.lang
+                    )
+                )
+
+        images, page_texts = render_and_extract(
+            searchable_pdf,
+            pages_dir,
+            image_format=image_format,
+            dpi=dpi,
+            on_page_saved=on_page_saved,
+        )
+        if title_futures:
+            title = title_futures[0].result()
+    if title_image:
+        title_image.unlink(missing_ok=True)
 
     if title:
         new_dir = ensure_unique_dir(output_root / title)
         if new_dir != output_dir:
+            # Cached documents are keyed by path and hold open file handles.
+            _open_pdf_cached.cache_clear()
             output_dir.rename(new_dir)
             output_dir = new_dir
             pages_dir = output_dir / "pages"
@@ -262,7 +590,6 @@ def main() -> None:
             source_pdf = output_dir / "source.pdf"
             images = [pages_dir / image.name for image in images]
 
-    page_texts = extract_text_by_page(searchable_pdf)
     markdown_path = output_dir / "deck.md"
     write_markdown(markdown_path, page_texts, images)
 
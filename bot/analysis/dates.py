@@ -0,0 +1,25 @@
+"""Timestamp parsing shared by the export analysis tools."""
+
+from datetime import datetime
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
+
+def parse_export_date(date_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp from a Telegram export.
+
+    Uses ciso8601's C parser when installed (see
+    requirements-analysis.txt); otherwise datetime.fromisoformat, rewriting
+    a trailing "Z" since Python 3.10 does not accept it.
+
+    Raises:
+        ValueError: If date_str is not an ISO 8601 timestamp.
+    """
+    if parse_datetime is not None:
+        return parse_datetime(date_str)
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+    return datetime.fromisoformat(date_str)
@@ -7,19 +7,63 @@ classification accuracy against historical data.
 
 import json
 import csv
+from array import array
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import re
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from bot.utils.link_detector import LinkDetector, LinkType, DetectedLink
+from bot.analysis.dates import parse_export_date
+from deal_extractor.links import LinkDetector, LinkType, DetectedLink
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FilterReason(IntEnum):
+    """Why the filter ladder accepted or skipped a message.
+
+    Results carry the int code; the human-readable label is only built for
+    output (CLI summary and exports).
+    """
+
+    FROM_BOT = 0
+    NO_CONTENT = 1
+    HAS_ATTACHMENT = 2
+    TOO_SHORT = 3
+    FORWARDED_MESSAGE = 4
+    LOOKS_LIKE_DEAL = 5
+    LONG_MESSAGE = 6
+    NO_DEAL_KEYWORDS_FOUND = 7
+
+    @property
+    def label(self) -> str:
+        """Label as shown in reports, e.g. "no deal keywords found"."""
+        return self.name.lower().replace("_", " ")
+
+
+@dataclass(slots=True)
 class SimulatedMessage:
     """Simulates a Telegram Message for testing."""
 
@@ -36,21 +80,74 @@ class SimulatedMessage:
     forward_from: Optional[str]
     reply_to_message_id: Optional[int]
 
+    # Derived once at construction instead of per classification step
+    text_lower: str = field(init=False)
+    text_len: int = field(init=False)
+    is_pdf: bool = field(init=False)
+
+    def __post_init__(self):
+        content = self.text or self.caption or ""
+        self.text_lower = content.lower()
+        self.text_len = len(content)
+        self.is_pdf = self.has_document and (
+            (self.document_file_name or "").lower().endswith(".pdf")
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of classifying a message."""
 
     message_id: int
     should_process: bool
-    filter_reason: str
+    filter_reason: FilterReason
     looks_like_deal: bool
     detected_links: list[DetectedLink] = field(default_factory=list)
     best_deck_link: Optional[DetectedLink] = None
     original_text: str = ""
+    text_len: int = 0
     sender: str = ""
     date: Optional[datetime] = None
 
+    @property
+    def filter_reason_text(self) -> str:
+        """Per-message filter reason for exports, e.g. "too short (3 chars)"."""
+        if self.filter_reason is FilterReason.TOO_SHORT:
+            return f"too short ({self.text_len} chars)"
+        return self.filter_reason.label
+
+
+@dataclass
+class ResultColumns:
+    """Column-oriented copy of the fields run_test aggregates over.
+
+    Flags are stored one byte per message, so counts are a single C-level
+    bytearray.count(1) rather than a Python loop over result objects. The
+    filter reason and link type histograms are accumulated as each batch
+    arrives, so run_test never walks the results again to aggregate.
+    """
+
+    message_id: array = field(default_factory=lambda: array("q"))
+    should_process: bytearray = field(default_factory=bytearray)
+    looks_like_deal: bytearray = field(default_factory=bytearray)
+    has_deck_link: bytearray = field(default_factory=bytearray)
+    filter_reasons: Counter = field(default_factory=Counter)
+    link_types: Counter = field(default_factory=Counter)
+
+    def extend(self, results: list[ClassificationResult]) -> None:
+        """Append the aggregated fields of a batch of results."""
+        self.message_id.extend(r.message_id for r in results)
+        self.should_process.extend(r.should_process for r in results)
+        self.looks_like_deal.extend(r.looks_like_deal for r in results)
+        self.has_deck_link.extend(r.best_deck_link is not None for r in results)
+        self.filter_reasons.update(r.filter_reason for r in results)
+        self.link_types.update(
+            link.link_type.value for r in results for link in r.detected_links
+        )
+
+    def __len__(self) -> int:
+        return len(self.message_id)
+
 
 class MessageClassifier:
     """Simulates the bot's message classification logic."""
@@ -68,105 +165,298 @@ class MessageClassifier:
         "pitch.com", "docs.google.com", "loom.com",
     ]
 
-    def __init__(self):
-        self.link_detector = LinkDetector()
+    # Both lists as one alternation, compiled once at import time
+    DEAL_PATTERN = re.compile("|".join(map(re.escape, DEAL_KEYWORDS + URL_PATTERNS)))
+
+    # Opt-in whole-word variant: alphabetic keywords must match a whole token
+    # ("seed" no longer matches "seeded"), the rest stay substring checks.
+    # The bot itself still uses substring matching.
+    WORD_KEYWORDS = frozenset(k for k in DEAL_KEYWORDS if k.isalpha())
+    SUBSTRING_PATTERNS = tuple(
+        k for k in DEAL_KEYWORDS + URL_PATTERNS if not k.isalpha()
+    )
+    TOKEN_PATTERN = re.compile(r"\w+")
+    WHOLE_WORD_PATTERN = re.compile(
+        r"\b(?:" + "|".join(map(re.escape, sorted(WORD_KEYWORDS))) + r")\b|"
+        + "|".join(map(re.escape, SUBSTRING_PATTERNS))
+    )
+
+    # Cheap prefilter ahead of the full scan: every match starts with one of
+    # these characters and is at least MIN_PATTERN_LEN long, so texts that
+    # fail either check ("ok", "thanks!", emoji) cannot match.
+    PATTERN_FIRST_CHARS = frozenset(k[0] for k in DEAL_KEYWORDS + URL_PATTERNS)
+    MIN_PATTERN_LEN = min(map(len, DEAL_KEYWORDS + URL_PATTERNS))
+
+    # LinkDetector is stateless, so one instance is shared by every
+    # classifier in the process (including the per-worker classifiers)
+    _LINK_DETECTOR = LinkDetector()
+
+    # Forwarded pitches repeat verbatim across an export; classification
+    # outcomes are memoized per (text, message flags), oldest evicted first
+    OUTCOME_CACHE_SIZE = 50_000
+
+    def __init__(self, whole_word_keywords: bool = False):
+        self.link_detector = self._LINK_DETECTOR
+        self.whole_word_keywords = whole_word_keywords
+        self._batch_pattern = (
+            self.WHOLE_WORD_PATTERN if whole_word_keywords else self.DEAL_PATTERN
+        )
+        self._has_deal_pattern = self._build_deal_matcher()
+        self._outcome_cache: dict[tuple, tuple] = {}
+
+    def _build_deal_matcher(self):
+        """Build a single-pass matcher for DEAL_KEYWORDS + URL_PATTERNS.
+
+        Uses a pyahocorasick automaton when installed, otherwise the
+        class-level DEAL_PATTERN alternation. Either way the text is scanned
+        once instead of once per keyword.
+
+        In whole-word mode the text is tokenized once and intersected with
+        the WORD_KEYWORDS frozenset, then the few SUBSTRING_PATTERNS are
+        checked.
 
-    def classify(self, message: SimulatedMessage) -> ClassificationResult:
+        The returned matcher applies the PATTERN_FIRST_CHARS / MIN_PATTERN_LEN
+        prefilter before the full scan.
+
+        Returns:
+            Callable taking lowercased text, True if any pattern occurs.
+        """
+        scan = self._build_pattern_scan()
+        first_chars = self.PATTERN_FIRST_CHARS
+        min_len = self.MIN_PATTERN_LEN
+        return lambda text: (
+            len(text) >= min_len and not first_chars.isdisjoint(text) and scan(text)
+        )
+
+    def _build_pattern_scan(self):
+        """Build the full-text scan used by _build_deal_matcher."""
+        if self.whole_word_keywords:
+            words = self.WORD_KEYWORDS
+            substrings = self.SUBSTRING_PATTERNS
+            tokenize = self.TOKEN_PATTERN.findall
+            return lambda text: (
+                not words.isdisjoint(tokenize(text))
+                or any(pattern in text for pattern in substrings)
+            )
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for pattern in self.DEAL_KEYWORDS + self.URL_PATTERNS:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            return lambda text: next(automaton.iter(text), None) is not None
+
+        search = self.DEAL_PATTERN.search
+        return lambda text: search(text) is not None
+
+    def classify_all(
+        self, messages: list[SimulatedMessage]
+    ) -> list[ClassificationResult]:
+        """Classify a batch of messages.
+
+        Keyword matching for the whole batch is done up front in one
+        columnar pass (see _batch_keyword_hits), so the per-message ladder
+        only reads a precomputed flag.
+
+        Args:
+            messages: SimulatedMessages to classify.
+
+        Returns:
+            ClassificationResult per message, in input order.
+        """
+        hits = self._batch_keyword_hits([m.text_lower for m in messages])
+        classify = self.classify
+        return [classify(msg, hit) for msg, hit in zip(messages, hits)]
+
+    def _batch_keyword_hits(self, texts: list[str]) -> list[bool]:
+        """Check which texts contain a deal keyword or URL pattern.
+
+        All texts are joined with NUL separators (which no pattern contains)
+        and scanned by the classifier's alternation (DEAL_PATTERN, or
+        WHOLE_WORD_PATTERN in whole-word mode); after each hit the scan
+        jumps straight to the next text, so there is one C-level search per
+        matching text.
+
+        Args:
+            texts: Lowercased message texts.
+
+        Returns:
+            True/False per text, in input order.
+        """
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        joined = "\0".join(texts)
+
+        hits = [False] * len(texts)
+        search = self._batch_pattern.search
+        pos = 0
+        while match := search(joined, pos):
+            index = bisect_right(starts, match.start()) - 1
+            hits[index] = True
+            if index + 1 == len(starts):
+                break
+            pos = starts[index + 1]
+        return hits
+
+    def classify(
+        self,
+        message: SimulatedMessage,
+        keyword_hit: Optional[bool] = None,
+    ) -> ClassificationResult:
         """Classify a message using the same logic as the bot.
 
         Args:
             message: SimulatedMessage to classify.
+            keyword_hit: Precomputed keyword match from classify_all, if any.
 
         Returns:
             ClassificationResult with classification details.
         """
+        text = message.text or message.caption or ""
         result = ClassificationResult(
             message_id=message.message_id,
             should_process=False,
-            filter_reason="",
+            filter_reason=FilterReason.NO_CONTENT,
             looks_like_deal=False,
-            original_text=message.text or message.caption or "",
+            original_text=text,
+            text_len=message.text_len,
             sender=message.from_user_name,
             date=message.date,
         )
 
+        key = (
+            text,
+            message.from_user_is_bot,
+            message.has_document,
+            message.is_pdf,
+            message.has_photo,
+            message.is_forwarded,
+        )
+        outcome = self._outcome_cache.get(key)
+        if outcome is None:
+            outcome = self._classify_content(message, text, keyword_hit)
+            if len(self._outcome_cache) >= self.OUTCOME_CACHE_SIZE:
+                del self._outcome_cache[next(iter(self._outcome_cache))]
+            self._outcome_cache[key] = outcome
+
+        (
+            result.should_process,
+            result.filter_reason,
+            result.looks_like_deal,
+            result.detected_links,
+            result.best_deck_link,
+        ) = outcome
+        return result
+
+    def _classify_content(
+        self,
+        message: SimulatedMessage,
+        text: str,
+        keyword_hit: Optional[bool],
+    ) -> tuple:
+        """Run the filter ladder and link detection for one message.
+
+        Depends only on the text and the flags classify() uses as its cache
+        key, so the returned tuple is shared between duplicate messages
+        (detected links are never mutated after detection).
+
+        Returns:
+            Tuple of (should_process, filter_reason, looks_like_deal,
+            detected_links, best_deck_link).
+        """
+        should_process, filter_reason, looks_like_deal = self._run_filter_ladder(
+            message, text, keyword_hit
+        )
+
+        # Links are only resolved for messages the bot would process
+        if not should_process:
+            return False, filter_reason, looks_like_deal, [], None
+
+        links = self.link_detector.detect_links(text)
+        # Same pick as get_best_deck_link (links are sorted by priority),
+        # without scanning the text a second time
+        best_deck_link = next((link for link in links if link.is_deck), None)
+        return True, filter_reason, looks_like_deal, links, best_deck_link
+
+    def _run_filter_ladder(
+        self,
+        message: SimulatedMessage,
+        text: str,
+        keyword_hit: Optional[bool],
+    ) -> tuple[bool, FilterReason, bool]:
+        """Apply the bot's accept/skip rules in priority order.
+
+        Args:
+            message: SimulatedMessage being classified.
+            text: Message text or caption ("" if none).
+            keyword_hit: Precomputed keyword match, if any.
+
+        Returns:
+            Tuple of (should_process, filter_reason, looks_like_deal).
+        """
         # Skip messages from bots
         if message.from_user_is_bot:
-            result.filter_reason = "from bot"
-            return result
+            return False, FilterReason.FROM_BOT, False
 
-        # Check for content
-        has_text = bool(message.text or message.caption)
-        text = message.text or message.caption or ""
+        has_attachment = message.has_document or message.has_photo
 
         # Skip if no content at all
-        if not has_text and not message.has_document and not message.has_photo:
-            result.filter_reason = "no content"
-            return result
+        if not text and not has_attachment:
+            return False, FilterReason.NO_CONTENT, False
 
         # Accept any message with document/photo
-        if message.has_document or message.has_photo:
-            result.should_process = True
-            result.filter_reason = "has attachment"
-            result.looks_like_deal = self._looks_like_deal(message)
-            result.detected_links = self.link_detector.detect_links(text)
-            result.best_deck_link = self.link_detector.get_best_deck_link(text)
-            return result
+        if has_attachment:
+            looks_like_deal = self._looks_like_deal(message, keyword_hit)
+            return True, FilterReason.HAS_ATTACHMENT, looks_like_deal
 
         # Skip very short messages
-        if len(text) < 5:
-            result.filter_reason = f"too short ({len(text)} chars)"
-            return result
+        text_len = message.text_len
+        if text_len < 5:
+            return False, FilterReason.TOO_SHORT, False
 
         # Accept forwarded messages
         if message.is_forwarded:
-            result.should_process = True
-            result.filter_reason = "forwarded message"
-            result.looks_like_deal = self._looks_like_deal(message)
-            result.detected_links = self.link_detector.detect_links(text)
-            result.best_deck_link = self.link_detector.get_best_deck_link(text)
-            return result
+            looks_like_deal = self._looks_like_deal(message, keyword_hit)
+            return True, FilterReason.FORWARDED_MESSAGE, looks_like_deal
 
         # Check for deal-like content
-        looks_like_deal = self._looks_like_deal(message)
-        if looks_like_deal:
-            result.should_process = True
-            result.filter_reason = "looks like deal"
-            result.looks_like_deal = True
-            result.detected_links = self.link_detector.detect_links(text)
-            result.best_deck_link = self.link_detector.get_best_deck_link(text)
-            return result
+        if self._looks_like_deal(message, keyword_hit):
+            return True, FilterReason.LOOKS_LIKE_DEAL, True
 
         # Accept longer messages
-        if len(text) >= 50:
-            result.should_process = True
-            result.filter_reason = "long message"
-            result.detected_links = self.link_detector.detect_links(text)
-            result.best_deck_link = self.link_detector.get_best_deck_link(text)
-            return result
-
-        result.filter_reason = "no deal keywords found"
-        return result
+        if text_len >= 50:
+            return True, FilterReason.LONG_MESSAGE, False
 
-    def _looks_like_deal(self, message: SimulatedMessage) -> bool:
-        """Check if a message looks like a deal."""
-        # Has PDF attachment
-        if message.has_document:
-            file_name = message.document_file_name or ""
-            if file_name.lower().endswith(".pdf"):
-                return True
+        return False, FilterReason.NO_DEAL_KEYWORDS_FOUND, False
 
-        text = (message.text or message.caption or "").lower()
+    def _looks_like_deal(
+        self,
+        message: SimulatedMessage,
+        keyword_hit: Optional[bool] = None,
+    ) -> bool:
+        """Check if a message looks like a deal.
 
-        # Check for deal-related keywords
-        for keyword in self.DEAL_KEYWORDS:
-            if keyword in text:
-                return True
+        Args:
+            message: SimulatedMessage to check.
+            keyword_hit: Precomputed keyword match, if any.
 
-        # Check for common URL patterns
-        for pattern in self.URL_PATTERNS:
-            if pattern in text:
-                return True
+        Returns:
+            True if the message might be a deal.
+        """
+        # Has PDF attachment
+        if message.is_pdf:
+            return True
+
+        text = message.text_lower
+
+        # Check for deal-related keywords and common URL patterns
+        if keyword_hit is None:
+            keyword_hit = self._has_deal_pattern(text)
+        if keyword_hit:
+            return True
 
         # Forwarded messages need minimum substance to be considered deals
         # This reduces false positives on short forwarded questions/greetings
@@ -181,11 +471,29 @@ class MessageClassifier:
         return False
 
 
+# Per-process classifier for ReplayTester worker pools
+_worker_classifier: Optional[MessageClassifier] = None
+
+
+def _init_worker(whole_word_keywords: bool) -> None:
+    """Build the classifier once per worker process."""
+    global _worker_classifier
+    _worker_classifier = MessageClassifier(whole_word_keywords=whole_word_keywords)
+
+
+def _classify_batch(batch: list[SimulatedMessage]) -> list[ClassificationResult]:
+    """Classify one batch inside a worker process."""
+    return _worker_classifier.classify_all(batch)
+
+
 class ReplayTester:
     """Replays historical messages through classification logic."""
 
-    def __init__(self):
-        self.classifier = MessageClassifier()
+    # Messages loaded and classified per step when streaming an export
+    BATCH_SIZE = 10000
+
+    def __init__(self, whole_word_keywords: bool = False):
+        self.classifier = MessageClassifier(whole_word_keywords=whole_word_keywords)
 
     def load_export(self, json_path: str) -> list[SimulatedMessage]:
         """Load messages from Telegram export JSON.
@@ -196,26 +504,50 @@ class ReplayTester:
         Returns:
             List of SimulatedMessage objects.
         """
+        return list(self.iter_export(json_path))
+
+    def iter_export(self, json_path: str) -> Iterator[SimulatedMessage]:
+        """Yield messages from a Telegram export JSON one at a time.
+
+        With ijson installed the export is parsed incrementally, so only one
+        raw message dict is alive at a time; otherwise the whole file is
+        loaded at once (with orjson when installed, else json.load).
+
+        Args:
+            json_path: Path to the JSON export file.
+
+        Yields:
+            SimulatedMessage objects in export order.
+        """
         path = Path(json_path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ijson is not None:
+            with open(path, "rb") as f:
+                yield from self._convert_messages(ijson.items(f, "messages.item"))
+            return
+
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        yield from self._convert_messages(data.get("messages", []))
 
-        messages = []
-        for msg in data.get("messages", []):
+    def _convert_messages(self, raw_messages) -> Iterator[SimulatedMessage]:
+        """Convert raw export messages, skipping service entries."""
+        for msg in raw_messages:
             if msg.get("type") != "message":
                 continue
 
             sim_msg = self._convert_message(msg)
             if sim_msg:
-                messages.append(sim_msg)
-
-        return messages
+                yield sim_msg
 
     def _convert_message(self, msg: dict) -> Optional[SimulatedMessage]:
         """Convert export message to SimulatedMessage."""
         try:
             date_str = msg.get("date", "")
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            date = parse_export_date(date_str)
         except (ValueError, TypeError):
             date = datetime.now()
 
@@ -273,19 +605,18 @@ class ReplayTester:
         self,
         json_path: str,
         expected_deals_file: Optional[str] = None,
+        workers: int = 1,
     ) -> dict:
         """Run replay test on exported messages.
 
         Args:
             json_path: Path to Telegram export JSON.
             expected_deals_file: Optional CSV file with expected deal message IDs.
+            workers: Processes to classify batches in (1 = in-process).
 
         Returns:
             Test results dict.
         """
-        messages = self.load_export(json_path)
-        results: list[ClassificationResult] = []
-
         # Load expected deals if provided
         expected_deal_ids = set()
         if expected_deals_file:
@@ -294,33 +625,33 @@ class ReplayTester:
                 for row in reader:
                     expected_deal_ids.add(int(row.get("message_id", 0)))
 
-        # Classify all messages
-        for msg in messages:
-            result = self.classifier.classify(msg)
-            results.append(result)
+        # Classify messages batch by batch as the export streams in
+        results: list[ClassificationResult] = []
+        columns = ResultColumns()
+        for batch_results in self._classify_batches(json_path, workers):
+            results.extend(batch_results)
+            columns.extend(batch_results)
 
         # Calculate statistics
-        total = len(results)
-        processed = sum(1 for r in results if r.should_process)
-        deals = sum(1 for r in results if r.looks_like_deal)
-        with_deck_links = sum(1 for r in results if r.best_deck_link)
-
-        # Filter reason distribution
-        filter_reasons = {}
-        for r in results:
-            filter_reasons[r.filter_reason] = filter_reasons.get(r.filter_reason, 0) + 1
-
-        # Link type distribution among processed
-        link_types = {}
-        for r in results:
-            for link in r.detected_links:
-                lt = link.link_type.value
-                link_types[lt] = link_types.get(lt, 0) + 1
+        total = len(columns)
+        processed = columns.should_process.count(1)
+        deals = columns.looks_like_deal.count(1)
+        with_deck_links = columns.has_deck_link.count(1)
+
+        # Filter reason and link type distributions
+        filter_reasons = {
+            reason.label: count for reason, count in columns.filter_reasons.items()
+        }
+        link_types = dict(columns.link_types)
 
         # Accuracy metrics (if expected deals provided)
         accuracy_metrics = None
         if expected_deal_ids:
-            detected_ids = {r.message_id for r in results if r.looks_like_deal}
+            detected_ids = {
+                message_id
+                for message_id, is_deal in zip(columns.message_id, columns.looks_like_deal)
+                if is_deal
+            }
 
             true_positives = len(expected_deal_ids & detected_ids)
             false_positives = len(detected_ids - expected_deal_ids)
@@ -339,16 +670,17 @@ class ReplayTester:
                 "precision": precision,
                 "recall": recall,
                 "f1_score": f1,
-                "false_positive_examples": [
+                # islice stops each scan once 10 examples are found
+                "false_positive_examples": list(islice((
                     {"id": r.message_id, "text": r.original_text[:100]}
                     for r in results
                     if r.looks_like_deal and r.message_id not in expected_deal_ids
-                ][:10],
-                "false_negative_examples": [
+                ), 10)),
+                "false_negative_examples": list(islice((
                     {"id": r.message_id, "text": r.original_text[:100]}
                     for r in results
                     if not r.looks_like_deal and r.message_id in expected_deal_ids
-                ][:10],
+                ), 10)),
             }
 
         return {
@@ -362,6 +694,44 @@ class ReplayTester:
             "results": results,  # Full results for detailed analysis
         }
 
+    def _classify_batches(
+        self, json_path: str, workers: int
+    ) -> Iterator[list[ClassificationResult]]:
+        """Classify the export in BATCH_SIZE batches, in export order.
+
+        Messages are independent, so with workers > 1 batches are spread
+        over a process pool (regex and link work is CPU-bound and holds the
+        GIL, so threads would not help). At most workers * 2 batches are in
+        flight, so the export is still read incrementally.
+
+        Args:
+            json_path: Path to Telegram export JSON.
+            workers: Number of worker processes.
+
+        Yields:
+            Results for each batch.
+        """
+        messages = self.iter_export(json_path)
+        batches = iter(lambda: list(islice(messages, self.BATCH_SIZE)), [])
+
+        if workers <= 1:
+            for batch in batches:
+                yield self.classifier.classify_all(batch)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.classifier.whole_word_keywords,),
+        ) as executor:
+            pending: deque[Future] = deque()
+            for batch in batches:
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_classify_batch, batch))
+            while pending:
+                yield pending.popleft().result()
+
     def export_results(
         self,
         results: list[ClassificationResult],
@@ -390,18 +760,22 @@ class ReplayTester:
                 "deck_link_url", "text_preview",
             ])
 
-            for r in results:
-                writer.writerow([
+            # One writerows call over a generator: rows are produced lazily
+            # and the per-row loop runs inside the C writer
+            writer.writerows(
+                (
                     r.message_id,
                     r.date.isoformat() if r.date else "",
                     r.sender,
                     r.should_process,
-                    r.filter_reason,
+                    r.filter_reason_text,
                     r.looks_like_deal,
                     r.best_deck_link.link_type.value if r.best_deck_link else "",
                     r.best_deck_link.url if r.best_deck_link else "",
                     r.original_text[:100].replace("\n", " "),
-                ])
+                )
+                for r in results
+            )
 
     def _export_json(self, results: list[ClassificationResult], output_path: str):
         """Export results to JSON."""
@@ -412,7 +786,7 @@ class ReplayTester:
                 "date": r.date.isoformat() if r.date else None,
                 "sender": r.sender,
                 "should_process": r.should_process,
-                "filter_reason": r.filter_reason,
+                "filter_reason": r.filter_reason_text,
                 "looks_like_deal": r.looks_like_deal,
                 "detected_links": [
                     {"url": link.url, "type": link.link_type.value, "is_deck": link.is_deck}
@@ -425,6 +799,11 @@ class ReplayTester:
                 "text_preview": r.original_text[:200],
             })
 
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -457,12 +836,24 @@ def main():
         help="Output format (default: csv)",
     )
 
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for classification (default: 1)",
+    )
+    parser.add_argument(
+        "--whole-word-keywords",
+        action="store_true",
+        help="Match alphabetic deal keywords as whole words (stricter than the bot)",
+    )
+
     args = parser.parse_args()
 
-    tester = ReplayTester()
+    tester = ReplayTester(whole_word_keywords=args.whole_word_keywords)
 
     print(f"Loading: {args.json_path}")
-    results = tester.run_test(args.json_path, args.expected)
+    results = tester.run_test(args.json_path, args.expected, workers=args.workers)
 
     print("\n" + "=" * 50)
     print("REPLAY TEST RESULTS")
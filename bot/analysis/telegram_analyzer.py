@@ -2,21 +2,55 @@
 
 import json
 import re
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
 # Import existing link detector for consistency
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from bot.utils.link_detector import LinkDetector, LinkType
+from bot.analysis.dates import parse_export_date
+from deal_extractor.links import LinkDetector, LinkType
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse errors load_export / iter_messages can raise for a malformed export
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Link types that count as a deck link when looking for missed deals
+DECK_LINK_TYPES = frozenset({"docsend", "papermark", "pdf_direct"})
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> Optional[str]:
+    """Lowercased network location of a URL, or None if it does not parse."""
+    try:
+        return urlparse(url).netloc.lower()
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class MessageStats:
     """Statistics for a single message."""
 
@@ -32,12 +66,30 @@ class MessageStats:
     reply_to_id: Optional[int]
     links: list[str] = field(default_factory=list)
     link_types: list[str] = field(default_factory=list)
+    link_netlocs: list[Optional[str]] = field(default_factory=list)
     is_potential_deal: bool = False
     deal_confidence: str = "none"  # none, low, medium, high
     matched_keywords: list[str] = field(default_factory=list)
+    # Derived once for deal assessment and post-processing
+    text_lower: str = field(init=False, repr=False)
+    text_len: int = field(init=False, repr=False)
+    num_links: int = field(init=False, repr=False)
+    has_pdf_attachment: bool = field(init=False, repr=False)
+    has_deck_link: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.text_lower = self.text.lower()
+        self.text_len = len(self.text)
+        self.num_links = len(self.links)
+        self.has_pdf_attachment = bool(
+            self.has_attachment
+            and self.file_name
+            and self.file_name.lower().endswith(".pdf")
+        )
+        self.has_deck_link = not DECK_LINK_TYPES.isdisjoint(self.link_types)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis results."""
 
@@ -64,6 +116,7 @@ class AnalysisResult:
     multi_link_messages: list[MessageStats] = field(default_factory=list)
     url_shortener_links: list[str] = field(default_factory=list)
     unclassified_links: list[str] = field(default_factory=list)
+    unclassified_domains: Counter = field(default_factory=Counter)
     long_messages: list[MessageStats] = field(default_factory=list)  # >1000 chars
 
     # Sender analysis
@@ -98,11 +151,20 @@ class TelegramExportAnalyzer:
     ]
 
     # URL shortener domains (excluding youtu.be which is now properly classified)
-    URL_SHORTENERS = [
+    URL_SHORTENERS = frozenset({
         "bit.ly", "t.co", "goo.gl", "tinyurl.com", "ow.ly", "is.gd",
         "buff.ly", "short.io", "rebrand.ly", "cutt.ly", "tiny.cc",
         "lnkd.in",
-    ]
+    })
+    # Subdomains of a shortener (e.g. www.bit.ly), for one str.endswith call
+    _SHORTENER_SUFFIXES = tuple("." + domain for domain in URL_SHORTENERS)
+
+    # Raw messages handed to a worker at a time when analyzing in parallel
+    CHUNK_SIZE = 5000
+
+    # Substring signals used when looking for misclassified messages
+    GREETING_PATTERN = re.compile("hi|hello|hey|check")
+    COMPANY_SIGNAL_PATTERN = re.compile("we are|our team|building|solution")
 
     # Non-deal patterns (to reduce false positives)
     NON_DEAL_PATTERNS = [
@@ -113,11 +175,48 @@ class TelegramExportAnalyzer:
 
     def __init__(self):
         self.link_detector = LinkDetector()
-        self._non_deal_regex = [re.compile(p, re.I) for p in self.NON_DEAL_PATTERNS]
+        # All non-deal patterns as one alternation, so one match call suffices
+        self._non_deal_regex = re.compile(
+            "|".join(f"(?:{p})" for p in self.NON_DEAL_PATTERNS), re.I
+        )
+        # Keyword -> score weight, in report order: deal keywords, then the
+        # extended keywords not already listed
+        self._keyword_weights = {k: 1 for k in self.DEAL_KEYWORDS}
+        for k in self.EXTENDED_KEYWORDS:
+            self._keyword_weights.setdefault(k, 0.5)
+        self._find_keywords = self._build_keyword_matcher()
+
+    def _build_keyword_matcher(self):
+        """Build a single-pass matcher over DEAL_KEYWORDS + EXTENDED_KEYWORDS.
+
+        Uses a pyahocorasick automaton when installed, which reports every
+        keyword occurrence (including overlapping ones such as "ai" inside
+        "raise") in one pass over the text. Otherwise falls back to one
+        substring check per keyword.
+
+        Returns:
+            Callable taking lowercased text and returning the distinct
+            keywords it contains, in self._keyword_weights order.
+        """
+        keywords = list(self._keyword_weights)
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(keywords):
+                automaton.add_word(keyword, index)
+            automaton.make_automaton()
+            return lambda text: [
+                keywords[index]
+                for index in sorted({index for _, index in automaton.iter(text)})
+            ]
+
+        return lambda text: [keyword for keyword in keywords if keyword in text]
 
     def load_export(self, json_path: str) -> dict:
         """Load a Telegram export JSON file.
 
+        Parsed with orjson when installed, otherwise json.load.
+
         Args:
             json_path: Path to the JSON export file.
 
@@ -128,43 +227,103 @@ class TelegramExportAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"Export file not found: {json_path}")
 
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
-    def analyze(self, json_path: str) -> AnalysisResult:
+    def iter_messages(self, json_path: str) -> Iterator[dict]:
+        """Yield raw message dicts from a Telegram export JSON file.
+
+        With ijson installed the export is parsed incrementally, so only one
+        message dict is alive at a time; otherwise it falls back to
+        load_export.
+
+        Args:
+            json_path: Path to the JSON export file.
+
+        Yields:
+            Message dicts in export order, including service messages.
+        """
+        if ijson is None:
+            yield from self.load_export(json_path).get("messages", [])
+            return
+
+        path = Path(json_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Export file not found: {json_path}")
+
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "messages.item")
+
+    def analyze(self, json_path: str, workers: int = 1) -> AnalysisResult:
         """Analyze a Telegram export JSON file.
 
         Args:
             json_path: Path to the JSON export file.
+            workers: Processes to analyze message chunks in (1 = in-process).
 
         Returns:
             AnalysisResult with statistics and insights.
         """
-        data = self.load_export(json_path)
         result = AnalysisResult()
 
-        messages = data.get("messages", [])
-        result.total_messages = len(messages)
-
-        all_stats: list[MessageStats] = []
         dates: list[datetime] = []
 
-        for msg in messages:
-            stats = self._analyze_message(msg)
-            if stats:
-                all_stats.append(stats)
-                dates.append(stats.date)
-                self._update_result(result, stats)
+        for chunk_stats in self._analyze_chunks(json_path, workers):
+            result.total_messages += len(chunk_stats)
+            for stats in chunk_stats:
+                if stats:
+                    dates.append(stats.date)
+                    self._update_result(result, stats)
+                    # Failure candidates are picked in the same pass, so the
+                    # stats of ordinary messages are not kept around
+                    self._identify_failure_candidates(result, stats)
 
         # Set date range
         if dates:
             result.date_range = (min(dates), max(dates))
 
-        # Post-processing: identify failure candidates
-        self._identify_failure_candidates(result, all_stats)
-
         return result
 
+    def _analyze_chunks(
+        self, json_path: str, workers: int
+    ) -> Iterator[list[Optional[MessageStats]]]:
+        """Analyze the export in CHUNK_SIZE chunks, in export order.
+
+        _analyze_message only depends on the message dict, so with
+        workers > 1 chunks are spread over a process pool; folding the
+        stats into the AnalysisResult stays in this process. At most
+        workers * 2 chunks are in flight, so the export is still read
+        incrementally rather than parsed up front.
+
+        Args:
+            json_path: Path to the JSON export file.
+            workers: Number of worker processes.
+
+        Yields:
+            _analyze_message output per raw message of each chunk (None for
+            skipped service messages).
+        """
+        messages = self.iter_messages(json_path)
+        chunks = iter(lambda: list(islice(messages, self.CHUNK_SIZE)), [])
+
+        if workers <= 1:
+            for chunk in chunks:
+                yield [self._analyze_message(msg) for msg in chunk]
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            pending: deque[Future] = deque()
+            for chunk in chunks:
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_analyze_chunk, chunk))
+            while pending:
+                yield pending.popleft().result()
+
     def _analyze_message(self, msg: dict) -> Optional[MessageStats]:
         """Analyze a single message from the export.
 
@@ -181,7 +340,7 @@ class TelegramExportAnalyzer:
         # Parse date
         try:
             date_str = msg.get("date", "")
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            date = parse_export_date(date_str)
         except (ValueError, TypeError):
             date = datetime.now()
 
@@ -189,6 +348,10 @@ class TelegramExportAnalyzer:
         sender = msg.get("from", "Unknown")
         if isinstance(sender, dict):
             sender = sender.get("first_name", "") + " " + sender.get("last_name", "")
+        # A few senders repeat across the whole export: share one string each
+        # (also pickled once per chunk when analyzing in a process pool)
+        if isinstance(sender, str):
+            sender = sys.intern(sender)
 
         # Extract text (can be string or list of text entities)
         text = self._extract_text(msg)
@@ -212,20 +375,18 @@ class TelegramExportAnalyzer:
         # Check forwarding
         is_forwarded = bool(msg.get("forwarded_from"))
         forward_from = msg.get("forwarded_from")
+        if isinstance(forward_from, str):
+            forward_from = sys.intern(forward_from)
 
         # Check reply
         reply_to_id = msg.get("reply_to_message_id")
 
         # Detect links
         links = self.link_detector.extract_urls(text)
-        link_types = [self.link_detector.classify_url(url).value for url in links]
-
-        # Analyze deal potential
-        is_potential_deal, confidence, matched_keywords = self._assess_deal_potential(
-            text, links, link_types, has_attachment, file_name, is_forwarded
-        )
+        link_types = [lt.value for lt in self.link_detector.classify_urls(links)]
+        link_netlocs = [_netloc(url) for url in links]
 
-        return MessageStats(
+        stats = MessageStats(
             message_id=msg.get("id", 0),
             date=date,
             sender=sender,
@@ -238,10 +399,17 @@ class TelegramExportAnalyzer:
             reply_to_id=reply_to_id,
             links=links,
             link_types=link_types,
-            is_potential_deal=is_potential_deal,
-            deal_confidence=confidence,
-            matched_keywords=matched_keywords,
+            link_netlocs=link_netlocs,
+        )
+
+        # Analyze deal potential
+        stats.is_potential_deal, stats.deal_confidence, stats.matched_keywords = (
+            self._assess_deal_potential(
+                stats.text_lower, stats.text_len, links, link_types,
+                stats.has_pdf_attachment, is_forwarded,
+            )
         )
+        return stats
 
     def _extract_text(self, msg: dict) -> str:
         """Extract text content from a message.
@@ -255,24 +423,22 @@ class TelegramExportAnalyzer:
             return text
 
         if isinstance(text, list):
-            # Text is a list of entities
-            parts = []
-            for item in text:
-                if isinstance(item, str):
-                    parts.append(item)
-                elif isinstance(item, dict):
-                    parts.append(item.get("text", ""))
-            return "".join(parts)
+            # Text is a list of plain strings and entity dicts
+            return "".join(
+                item if isinstance(item, str) else item.get("text", "")
+                for item in text
+                if isinstance(item, (str, dict))
+            )
 
         return ""
 
     def _assess_deal_potential(
         self,
-        text: str,
+        text_lower: str,
+        text_len: int,
         links: list[str],
         link_types: list[str],
-        has_attachment: bool,
-        file_name: Optional[str],
+        has_pdf_attachment: bool,
         is_forwarded: bool,
     ) -> tuple[bool, str, list[str]]:
         """Assess whether a message is likely a deal.
@@ -280,17 +446,15 @@ class TelegramExportAnalyzer:
         Returns:
             Tuple of (is_potential_deal, confidence, matched_keywords).
         """
-        text_lower = text.lower()
         matched = []
         confidence_score = 0
 
         # Check for non-deal patterns first
-        for pattern in self._non_deal_regex:
-            if pattern.match(text_lower.strip()):
-                return False, "none", []
+        if self._non_deal_regex.match(text_lower.strip()):
+            return False, "none", []
 
         # PDF attachment is strong signal
-        if has_attachment and file_name and file_name.lower().endswith(".pdf"):
+        if has_pdf_attachment:
             confidence_score += 3
             matched.append("pdf_attachment")
 
@@ -304,7 +468,7 @@ class TelegramExportAnalyzer:
         # Forwarded messages in deal groups are often deals, but need substance
         # to avoid false positives on short forwarded questions/greetings
         if is_forwarded:
-            if len(text) >= 100:
+            if text_len >= 100:
                 # Substantial forwarded content
                 confidence_score += 1
                 matched.append("forwarded")
@@ -313,20 +477,13 @@ class TelegramExportAnalyzer:
                 confidence_score += 1
                 matched.append("forwarded")
 
-        # Check deal keywords
-        for keyword in self.DEAL_KEYWORDS:
-            if keyword in text_lower:
-                confidence_score += 1
-                matched.append(keyword)
-
-        # Check extended keywords (lower weight)
-        for keyword in self.EXTENDED_KEYWORDS:
-            if keyword in text_lower and keyword not in matched:
-                confidence_score += 0.5
-                matched.append(keyword)
+        # Check deal keywords, then extended keywords (lower weight)
+        keywords = self._find_keywords(text_lower)
+        confidence_score += sum(map(self._keyword_weights.__getitem__, keywords))
+        matched.extend(keywords)
 
         # Longer text with links is more likely a deal
-        if len(text) > 100 and links:
+        if text_len > 100 and links:
             confidence_score += 1
 
         # Determine confidence level
@@ -354,8 +511,7 @@ class TelegramExportAnalyzer:
             result.replies += 1
 
         # Link types
-        for lt in stats.link_types:
-            result.link_type_counts[lt] += 1
+        result.link_type_counts.update(stats.link_types)
         result.all_links.extend(stats.links)
 
         # Deal detection
@@ -363,29 +519,28 @@ class TelegramExportAnalyzer:
             result.potential_deals += 1
         result.deal_confidence_dist[stats.deal_confidence] += 1
 
-        for kw in stats.matched_keywords:
-            result.keyword_hits[kw] += 1
+        result.keyword_hits.update(stats.matched_keywords)
 
         # Edge cases
-        if len(stats.links) > 1:
+        if stats.num_links > 1:
             result.multi_link_messages.append(stats)
 
-        if len(stats.text) > 1000:
+        if stats.text_len > 1000:
             result.long_messages.append(stats)
 
         # Check for URL shorteners
-        for link in stats.links:
-            try:
-                domain = urlparse(link).netloc.lower()
-                if any(short in domain for short in self.URL_SHORTENERS):
-                    result.url_shortener_links.append(link)
-            except Exception:
-                pass
+        for link, domain in zip(stats.links, stats.link_netlocs):
+            if domain is None:
+                continue
+            if domain in self.URL_SHORTENERS or domain.endswith(self._SHORTENER_SUFFIXES):
+                result.url_shortener_links.append(link)
 
         # Check for unclassified links
-        for link, lt in zip(stats.links, stats.link_types):
+        for link, lt, domain in zip(stats.links, stats.link_types, stats.link_netlocs):
             if lt in ("website", "unknown"):
                 result.unclassified_links.append(link)
+                if domain is not None:
+                    result.unclassified_domains[domain] += 1
 
         # Sender stats
         result.sender_counts[stats.sender] += 1
@@ -395,46 +550,37 @@ class TelegramExportAnalyzer:
     def _identify_failure_candidates(
         self,
         result: AnalysisResult,
-        all_stats: list[MessageStats],
+        stats: MessageStats,
     ) -> None:
-        """Identify messages that might be misclassified.
+        """Record a message if it might be misclassified.
 
         False positives: Detected as deals but probably aren't.
         False negatives: Not detected as deals but probably are.
         """
-        for stats in all_stats:
-            # Potential false positives
-            if stats.is_potential_deal:
-                # Very short messages with only low-confidence keywords
-                if len(stats.text) < 30 and stats.deal_confidence == "low":
+        # Potential false positives
+        if stats.is_potential_deal:
+            # Very short messages with only low-confidence keywords
+            if stats.text_len < 30 and stats.deal_confidence == "low":
+                result.likely_false_positives.append(stats)
+            # Messages that are just greetings with a link
+            elif stats.text_len < 50 and not stats.has_attachment:
+                if self.GREETING_PATTERN.search(stats.text_lower):
                     result.likely_false_positives.append(stats)
-                # Messages that are just greetings with a link
-                elif len(stats.text) < 50 and not stats.has_attachment:
-                    text_lower = stats.text.lower()
-                    if any(g in text_lower for g in ["hi", "hello", "hey", "check"]):
-                        result.likely_false_positives.append(stats)
-
-            # Potential false negatives
-            else:
-                # Has deck link but not detected
-                has_deck_link = any(
-                    lt in ["docsend", "papermark", "pdf_direct"]
-                    for lt in stats.link_types
-                )
-                if has_deck_link:
-                    result.likely_false_negatives.append(stats)
 
-                # Has PDF attachment but not detected
-                if stats.has_attachment:
-                    if stats.file_name and stats.file_name.lower().endswith(".pdf"):
-                        result.likely_false_negatives.append(stats)
+        # Potential false negatives
+        else:
+            # Has deck link but not detected
+            if stats.has_deck_link:
+                result.likely_false_negatives.append(stats)
+
+            # Has PDF attachment but not detected
+            if stats.has_pdf_attachment:
+                result.likely_false_negatives.append(stats)
 
-                # Long message with company-like content
-                if len(stats.text) > 200:
-                    text_lower = stats.text.lower()
-                    company_signals = ["we are", "our team", "building", "solution"]
-                    if any(s in text_lower for s in company_signals):
-                        result.likely_false_negatives.append(stats)
+            # Long message with company-like content
+            if stats.text_len > 200:
+                if self.COMPANY_SIGNAL_PATTERN.search(stats.text_lower):
+                    result.likely_false_negatives.append(stats)
 
     def generate_report(self, result: AnalysisResult) -> str:
         """Generate a human-readable report from analysis results.
@@ -504,15 +650,8 @@ class TelegramExportAnalyzer:
 
         # Unclassified links (show unique domains)
         if result.unclassified_links:
-            domains = Counter()
-            for link in result.unclassified_links:
-                try:
-                    domain = urlparse(link).netloc.lower()
-                    domains[domain] += 1
-                except Exception:
-                    pass
             lines.append("  Top unclassified domains:")
-            for domain, count in domains.most_common(10):
+            for domain, count in result.unclassified_domains.most_common(10):
                 lines.append(f"    {domain}: {count}")
             lines.append("")
 
@@ -610,10 +749,33 @@ class TelegramExportAnalyzer:
             "forwarded_sources": dict(result.forwarded_sources.most_common(30)),
         }
 
+        if orjson is not None:
+            # Deleted accounts export "from": null, so sender keys can be None
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(
+                    export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            return
+
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(export_data, f, indent=2, ensure_ascii=False)
 
 
+# Per-process analyzer for TelegramExportAnalyzer worker pools
+_worker_analyzer: Optional[TelegramExportAnalyzer] = None
+
+
+def _init_worker() -> None:
+    """Build the analyzer (and its keyword automaton) once per worker."""
+    global _worker_analyzer
+    _worker_analyzer = TelegramExportAnalyzer()
+
+
+def _analyze_chunk(chunk: list[dict]) -> list[Optional[MessageStats]]:
+    """Analyze one chunk of raw messages inside a worker process."""
+    return [_worker_analyzer._analyze_message(msg) for msg in chunk]
+
+
 def main():
     """CLI entry point for analysis."""
     import argparse
@@ -635,6 +797,12 @@ def main():
         action="store_true",
         help="Only output summary statistics",
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for message analysis (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -644,7 +812,7 @@ def main():
     print()
 
     try:
-        result = analyzer.analyze(args.json_path)
+        result = analyzer.analyze(args.json_path, workers=args.workers)
 
         if not args.quiet:
             report = analyzer.generate_report(result)
@@ -661,7 +829,7 @@ def main():
     except FileNotFoundError as e:
         print(f"Error: {e}")
         return 1
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         print(f"Error parsing JSON: {e}")
         return 1
 
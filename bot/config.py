@@ -1,13 +1,92 @@
 """Configuration management for the Deal Logging Bot."""
 
 import os
+import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional
 
 from dotenv import load_dotenv
 
+# Environment variables Config.load refuses to start without
+_REQUIRED_ENV_VARS = (
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_GROUP_ID",
+    "NOTION_API_KEY",
+    "NOTION_DATABASE_ID",
+    "KIMI_API_KEY",
+)
+
+# Values accepted as "enabled" for boolean env flags (compared lowercased)
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+# Plain KEY=value lines, the only syntax _load_env_file parses itself
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^=#\s]+)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+# Quoting, escapes, expansion, inline comments, "export" or CRLF: left to python-dotenv
+_ENV_SPECIAL_RE = re.compile(r"""["'$\\\r]|[ \t]#|^[ \t]*export[ \t]""", re.M)
+
+# .env files already applied to os.environ, by path -> st_mtime_ns at the time
+_DOTENV_MTIMES: dict[Path, int] = {}
+
+
+def _load_env_file(path: Path) -> None:
+    """Apply a .env file to os.environ, overriding existing values.
+
+    Flat KEY=value files are parsed with a regex; anything using quotes,
+    escapes, variable expansion or "export" goes through python-dotenv.
+    The file is only parsed again if its modification time changed since
+    the last load.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return  # No .env file: settings come from the environment only
+    if _DOTENV_MTIMES.get(path) == mtime:
+        return
+    text = path.read_text(encoding="utf-8-sig")
+    if _ENV_SPECIAL_RE.search(text):
+        load_dotenv(path, override=True)
+    else:
+        os.environ.update(_ENV_LINE_RE.findall(text))
+    _DOTENV_MTIMES[path] = mtime
+
+
+# Paths derived from this file's location, resolved once at import
+_PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+_DEFAULT_ENV_PATH = _PROJECT_ROOT / ".env"
+_PDF_EXTRACTOR_PATH = _PROJECT_ROOT / "PDF_Extractor 2" / "pdf2llm.py"
+_TEMP_DIR = _PROJECT_ROOT / "temp"
+
+
+@cache
+def _temp_dir() -> Path:
+    """Scratch directory under the project root, created on first use."""
+    if not os.path.isdir(_TEMP_DIR):
+        _TEMP_DIR.mkdir(exist_ok=True)
+    return _TEMP_DIR
+
+
+@lru_cache(maxsize=64)
+def _validate(docsend_email: str, pdf_extractor_path: Path) -> tuple[str, ...]:
+    """Config.validate warnings, cached so repeat calls skip the stat()."""
+    warnings = []
+
+    if not docsend_email:
+        warnings.append(
+            "DOCSEND_EMAIL not set - DocSend extraction will be limited"
+        )
+
+    if not pdf_extractor_path.exists():
+        warnings.append(
+            f"PDF extractor not found at {pdf_extractor_path} - "
+            "PDF processing will fail"
+        )
+
+    return tuple(warnings)
+
 
 class DocSendExtractionMode(str, Enum):
     """DocSend extraction mode options."""
@@ -15,8 +94,13 @@ class DocSendExtractionMode(str, Enum):
     AUTO = "auto"  # Use Playwright with cookie persistence
     PLAYWRIGHT = "playwright"  # Playwright browser automation
 
+    @classmethod
+    def _missing_(cls, value):
+        """Fall back to AUTO for unknown values instead of raising."""
+        return cls.AUTO
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Bot configuration loaded from environment variables."""
 
@@ -41,6 +125,7 @@ class Config:
 
     # Settings
     message_grouping_timeout: int
+    whole_word_keywords: bool  # Deal keywords must match whole words
     ocr_language: str
     telegram_proxy: Optional[str]  # Proxy for Telegram API
 
@@ -52,18 +137,33 @@ class Config:
     # Browser agent (opt-in, last-resort fallback)
     browser_agent_enabled: bool
 
-    # Paths
-    project_root: Path
-    pdf_extractor_path: Path
-    temp_dir: Path
+    # Paths are derived from this file's location (see module constants)
+    @property
+    def project_root(self) -> Path:
+        """Repository root directory."""
+        return _PROJECT_ROOT
+
+    @property
+    def pdf_extractor_path(self) -> Path:
+        """Path to the PDF_Extractor 2 pdf2llm.py script."""
+        return _PDF_EXTRACTOR_PATH
+
+    @property
+    def temp_dir(self) -> Path:
+        """Scratch directory for downloads (created on first access)."""
+        return _temp_dir()
 
     @classmethod
-    def load(cls, env_path: Optional[Path] = None) -> "Config":
+    def load(cls, env_path: Optional[Path] = None, reset: bool = False) -> "Config":
         """Load configuration from environment variables.
 
+        The loaded Config is cached for the process; later calls with the same
+        env_path return it without re-reading the environment.
+
         Args:
             env_path: Optional path to .env file. If not provided, looks for .env
                       in the project root directory.
+            reset: Reload even if a Config for env_path is already cached.
 
         Returns:
             Config instance with all settings loaded.
@@ -71,71 +171,63 @@ class Config:
         Raises:
             ValueError: If required environment variables are missing.
         """
-        # Determine project root
-        project_root = Path(__file__).parent.parent.resolve()
+        global _CONFIG_CACHE, _CACHE_KEY
+        if not reset and _CONFIG_CACHE is not None and _CACHE_KEY == env_path:
+            return _CONFIG_CACHE
+
+        config = cls._load(env_path)
+        _CONFIG_CACHE, _CACHE_KEY = config, env_path
+        return config
 
+    @classmethod
+    def _load(cls, env_path: Optional[Path]) -> "Config":
+        """Build a Config from the environment (uncached, see load)."""
         # Load .env file (override shell env so project config is authoritative)
-        if env_path:
-            load_dotenv(env_path, override=True)
-        else:
-            load_dotenv(project_root / ".env", override=True)
-
-        # Required variables
-        telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        if not telegram_bot_token:
-            raise ValueError("TELEGRAM_BOT_TOKEN is required")
-
-        telegram_group_id_str = os.getenv("TELEGRAM_GROUP_ID")
-        if not telegram_group_id_str:
-            raise ValueError("TELEGRAM_GROUP_ID is required")
+        _load_env_file(env_path or _DEFAULT_ENV_PATH)
+
+        env_get = os.environ.get
+
+        # Required variables (all missing ones are reported together)
+        required = {name: env_get(name) for name in _REQUIRED_ENV_VARS}
+        missing = [name for name, value in required.items() if not value]
+        if missing:
+            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+
+        telegram_bot_token = required["TELEGRAM_BOT_TOKEN"]
+        notion_api_key = required["NOTION_API_KEY"]
+        notion_database_id = required["NOTION_DATABASE_ID"]
+        kimi_api_key = required["KIMI_API_KEY"]
+
         # Support comma-separated group IDs for monitoring multiple groups
         telegram_group_ids = frozenset(
-            int(gid.strip()) for gid in telegram_group_id_str.split(",") if gid.strip()
+            int(gid.strip()) for gid in required["TELEGRAM_GROUP_ID"].split(",") if gid.strip()
         )
         if not telegram_group_ids:
             raise ValueError("TELEGRAM_GROUP_ID must contain at least one group ID")
 
-        notion_api_key = os.getenv("NOTION_API_KEY")
-        if not notion_api_key:
-            raise ValueError("NOTION_API_KEY is required")
-
-        notion_database_id = os.getenv("NOTION_DATABASE_ID")
-        if not notion_database_id:
-            raise ValueError("NOTION_DATABASE_ID is required")
-
-        kimi_api_key = os.getenv("KIMI_API_KEY")
-        if not kimi_api_key:
-            raise ValueError("KIMI_API_KEY is required")
+        kimi_model = env_get("KIMI_MODEL", "moonshot-v1-8k")
 
-        kimi_model = os.getenv("KIMI_MODEL", "moonshot-v1-8k")
-
-        docsend_email = os.getenv("DOCSEND_EMAIL", "")
-        docsend_password = os.getenv("DOCSEND_PASSWORD")
+        docsend_email = env_get("DOCSEND_EMAIL", "")
+        docsend_password = env_get("DOCSEND_PASSWORD")
 
         # DocSend extraction settings
-        extraction_mode_str = os.getenv("DOCSEND_EXTRACTION_MODE", "auto")
-        try:
-            docsend_extraction_mode = DocSendExtractionMode(extraction_mode_str)
-        except ValueError:
-            docsend_extraction_mode = DocSendExtractionMode.AUTO
+        docsend_extraction_mode = DocSendExtractionMode(
+            env_get("DOCSEND_EXTRACTION_MODE", "auto")
+        )
 
         # Optional settings with defaults
-        message_grouping_timeout = int(os.getenv("MESSAGE_GROUPING_TIMEOUT", "30"))
-        ocr_language = os.getenv("OCR_LANGUAGE", "chi_sim+eng")
-        telegram_proxy = os.getenv("TELEGRAM_PROXY")  # None if not set
+        message_grouping_timeout = int(env_get("MESSAGE_GROUPING_TIMEOUT", "30"))
+        whole_word_keywords = env_get("WHOLE_WORD_KEYWORDS", "false").lower() in _TRUTHY
+        ocr_language = env_get("OCR_LANGUAGE", "chi_sim+eng")
+        telegram_proxy = env_get("TELEGRAM_PROXY")  # None if not set
 
         # Cleanup settings (important for cloud deployment)
-        cleanup_after_extract = os.getenv("CLEANUP_AFTER_EXTRACT", "false").lower() in ("true", "1", "yes")
-        cleanup_max_age_minutes = int(os.getenv("CLEANUP_MAX_AGE_MINUTES", "1440"))  # 24 hours
-        cleanup_interval_minutes = int(os.getenv("CLEANUP_INTERVAL_MINUTES", "1440"))  # 24 hours
+        cleanup_after_extract = env_get("CLEANUP_AFTER_EXTRACT", "false").lower() in _TRUTHY
+        cleanup_max_age_minutes = int(env_get("CLEANUP_MAX_AGE_MINUTES", "1440"))  # 24 hours
+        cleanup_interval_minutes = int(env_get("CLEANUP_INTERVAL_MINUTES", "1440"))  # 24 hours
 
         # Browser agent (opt-in, requires browser-use + langchain-openai)
-        browser_agent_enabled = os.getenv("BROWSER_AGENT_ENABLED", "false").lower() in ("true", "1", "yes")
-
-        # Paths
-        pdf_extractor_path = project_root / "PDF_Extractor 2" / "pdf2llm.py"
-        temp_dir = project_root / "temp"
-        temp_dir.mkdir(exist_ok=True)
+        browser_agent_enabled = env_get("BROWSER_AGENT_ENABLED", "false").lower() in _TRUTHY
 
         return cls(
             telegram_bot_token=telegram_bot_token,
@@ -148,38 +240,30 @@ class Config:
             docsend_password=docsend_password,
             docsend_extraction_mode=docsend_extraction_mode,
             message_grouping_timeout=message_grouping_timeout,
+            whole_word_keywords=whole_word_keywords,
             ocr_language=ocr_language,
             telegram_proxy=telegram_proxy,
             cleanup_after_extract=cleanup_after_extract,
             cleanup_max_age_minutes=cleanup_max_age_minutes,
             cleanup_interval_minutes=cleanup_interval_minutes,
             browser_agent_enabled=browser_agent_enabled,
-            project_root=project_root,
-            pdf_extractor_path=pdf_extractor_path,
-            temp_dir=temp_dir,
         )
 
     def validate(self) -> list[str]:
         """Validate the configuration and return any warnings.
 
+        The result is cached per (docsend_email, pdf_extractor_path), so the
+        PDF extractor is only checked for on disk once per process.
+
         Returns:
             List of warning messages for optional but recommended settings.
         """
-        warnings = []
-
-        if not self.docsend_email:
-            warnings.append(
-                "DOCSEND_EMAIL not set - DocSend extraction will be limited"
-            )
-
-        if not self.pdf_extractor_path.exists():
-            warnings.append(
-                f"PDF extractor not found at {self.pdf_extractor_path} - "
-                "PDF processing will fail"
-            )
+        return list(_validate(self.docsend_email, self.pdf_extractor_path))
 
-        return warnings
 
+# Config returned by Config.load, and the env_path it was loaded for
+_CONFIG_CACHE: Optional[Config] = None
+_CACHE_KEY: Optional[Path] = None
 
 # Notion field mappings (based on actual database schema)
 # - Name: title (page title)
@@ -188,17 +272,28 @@ class Config:
 # - External Source: rich_text
 # - Deck: rich_text (stores URL as text)
 # - Memo: rich_text (stores introduction)
-NOTION_FIELDS = {
-    "title": "Name",  # Page title (title property)
-    "tags": "Tags",  # rich_text - comma-separated
-    "op_source": "OP Source",  # multi_select
-    "external_source": "External Source",  # rich_text
-    "deck": "Deck",  # rich_text (URL as text)
-    "introduction": "Memo",  # rich_text
-}
-
-# Default tag options for deals
-DEFAULT_TAGS = [
+class NotionFields(NamedTuple):
+    """Notion property names, accessed as NOTION_FIELDS.<field>."""
+
+    title: str  # Page title (title property)
+    tags: str  # rich_text - comma-separated
+    op_source: str  # multi_select
+    external_source: str  # rich_text
+    deck: str  # rich_text (URL as text)
+    introduction: str  # rich_text
+
+
+NOTION_FIELDS = NotionFields(
+    title="Name",
+    tags="Tags",
+    op_source="OP Source",
+    external_source="External Source",
+    deck="Deck",
+    introduction="Memo",
+)
+
+# Default tag options for deals (read-only; DEFAULT_TAGS_SET for membership)
+DEFAULT_TAGS = tuple(map(sys.intern, (
     "DeFi",
     "AI",
     "Gaming",
@@ -214,4 +309,5 @@ DEFAULT_TAGS = [
     "Consumer",
     "Developer Tools",
     "Research",
-]
+)))
+DEFAULT_TAGS_SET = frozenset(DEFAULT_TAGS)
@@ -1,11 +1,15 @@
 """Telegram message handling with DealExtractor integration."""
 
 import asyncio
+import hashlib
 import logging
-from pathlib import Path
+import re
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Optional
 
 from telegram import Bot, Message, Update
+from telegram.error import RetryAfter, TimedOut
 from telegram.ext import ContextTypes
 
 from deal_extractor import DealExtractor, DuplicateInfo
@@ -16,10 +20,107 @@ from ..utils.grouping import MessageGroup, MessageGrouper
 
 logger = logging.getLogger(__name__)
 
+# forward_origin.type -> display name of the original sender (None if unknown)
+_FORWARD_ORIGIN_SOURCES = {
+    'user': lambda origin: origin.sender_user and (
+        origin.sender_user.full_name or origin.sender_user.username
+    ),
+    'hidden_user': lambda origin: origin.sender_user_name,
+    'chat': lambda origin: origin.sender_chat and origin.sender_chat.title,
+    'channel': lambda origin: origin.chat and origin.chat.title,
+}
+
+# Which forward attributes this python-telegram-bot version defines, checked
+# once instead of per message: forward_origin arrived in 20.8 (Bot API 7.0),
+# the legacy forward_from / forward_sender_name / forward_from_chat were
+# removed in 21.0
+_HAS_FORWARD_ORIGIN = hasattr(Message, 'forward_origin')
+_HAS_LEGACY_FORWARD = hasattr(Message, 'forward_from')
+
+# Legacy forward attribute -> display name of the original sender
+_LEGACY_FORWARD_SOURCES = (
+    ('forward_from', lambda user: user.full_name or user.username),
+    ('forward_sender_name', lambda name: name),
+    ('forward_from_chat', lambda chat: chat.title),
+)
+
+# Every casing of ".pdf", so suffix checks skip lowercasing the whole name
+_PDF_SUFFIXES = ('.pdf', '.PDF', '.Pdf', '.pDf', '.pdF', '.PDf', '.PdF', '.pDF')
+
+
+def _is_forwarded(message: Message) -> bool:
+    """Whether a Telegram message was forwarded from elsewhere."""
+    if _HAS_FORWARD_ORIGIN and message.forward_origin:
+        return True
+    if _HAS_LEGACY_FORWARD:
+        return bool(message.forward_from or message.forward_sender_name)
+    return False
+
+
+@dataclass(slots=True)
+class MessageFeatures:
+    """Message fields the filters need, read from the Telegram Message once."""
+
+    text: str
+    text_lower: str
+    text_len: int
+    has_document: bool
+    has_photo: bool
+    document_name: str
+    is_forwarded: bool
+
+    @classmethod
+    def from_message(cls, message: Message) -> "MessageFeatures":
+        """Compute the features of a Telegram message."""
+        text = message.text or message.caption or ""
+        document = message.document
+        return cls(
+            text=text,
+            text_lower=text.lower(),
+            text_len=len(text),
+            has_document=document is not None,
+            has_photo=bool(message.photo),
+            document_name=(document.file_name or "") if document else "",
+            is_forwarded=_is_forwarded(message),
+        )
+
 
 class MessageHandler:
     """Handles incoming Telegram messages and processes deals."""
 
+    # Substrings (of the lowercased text) that make a message look like a deal
+    DEAL_KEYWORDS = [
+        "docsend", "pitch", "deck", "investment", "funding", "series",
+        "seed", "pre-seed", "raise", "round", "valuation", "cap", "safe",
+        "equity", "tokenomics", "whitepaper", "intro", "meet", "connect",
+        "founder", "startup", "project", "protocol", "platform",
+    ]
+
+    URL_PATTERNS = [
+        "docsend.com", "papermark.io", "papermark.com", ".pdf", "notion.so",
+        "pitch.com", "docs.google.com", "loom.com",
+    ]
+
+    # All of the above as one alternation, so the text is scanned once
+    DEAL_PATTERN = re.compile("|".join(map(re.escape, DEAL_KEYWORDS + URL_PATTERNS)))
+
+    # Opt-in whole-word variant (WHOLE_WORD_KEYWORDS; replay_test
+    # --whole-word-keywords previews it on an export):
+    # alphabetic keywords must match a whole token, so "cap" no longer
+    # matches "escape"; the rest stay substring checks
+    WORD_KEYWORDS = frozenset(k for k in DEAL_KEYWORDS if k.isalpha())
+    SUBSTRING_PATTERNS = tuple(
+        k for k in DEAL_KEYWORDS + URL_PATTERNS if not k.isalpha()
+    )
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    # Maximum deals being written to Notion at once (shared across groups)
+    NOTION_CONCURRENCY = 5
+
+    # Seconds drain() waits for background deal logging at shutdown
+    # (docker-compose's stop_grace_period leaves room for it)
+    DRAIN_TIMEOUT = 30.0
+
     def __init__(
         self,
         deal_extractor: DealExtractor,
@@ -27,7 +128,7 @@ class MessageHandler:
         grouper: MessageGrouper,
         target_group_ids: frozenset[int],
         bot: Bot,
-        temp_dir: Path,
+        whole_word_keywords: bool = False,
     ):
         """Initialize the message handler.
 
@@ -37,14 +138,67 @@ class MessageHandler:
             grouper: MessageGrouper for grouping related messages.
             target_group_ids: Set of Telegram group IDs to monitor.
             bot: Telegram Bot instance.
-            temp_dir: Temporary directory for file downloads.
+            whole_word_keywords: Match alphabetic DEAL_KEYWORDS as whole
+                words only instead of as substrings.
         """
         self.deal_extractor = deal_extractor
         self.notion_client = notion_client
         self.grouper = grouper
         self.target_group_ids = target_group_ids
         self.bot = bot
-        self.temp_dir = temp_dir
+        self.whole_word_keywords = whole_word_keywords
+        self._notion_semaphore = asyncio.Semaphore(self.NOTION_CONCURRENCY)
+        self._active_tasks: set[asyncio.Task] = set()  # Background deal logging
+        self._has_deal_pattern = self._build_deal_matcher()
+
+    def _build_deal_matcher(self):
+        """Build a single-pass matcher for DEAL_KEYWORDS + URL_PATTERNS.
+
+        Uses the class-level DEAL_PATTERN alternation, so the text is
+        scanned once instead of once per keyword.
+
+        In whole-word mode the text is tokenized once and intersected with
+        the WORD_KEYWORDS frozenset, then the few SUBSTRING_PATTERNS are
+        checked.
+
+        Returns:
+            Callable taking lowercased text, True if any pattern occurs.
+        """
+        if self.whole_word_keywords:
+            words = self.WORD_KEYWORDS
+            substrings = self.SUBSTRING_PATTERNS
+            tokenize = self.TOKEN_PATTERN.findall
+            return lambda text: (
+                not words.isdisjoint(tokenize(text))
+                or any(pattern in text for pattern in substrings)
+            )
+
+        search = self.DEAL_PATTERN.search
+        return lambda text: search(text) is not None
+
+    async def drain(self, timeout: float = DRAIN_TIMEOUT) -> None:
+        """Wait for background deal logging to finish, e.g. before shutdown.
+
+        Tasks started while waiting are waited for too. Anything still
+        running after timeout is left to be cancelled with the event loop.
+
+        Args:
+            timeout: Maximum seconds to wait.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._active_tasks:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    f"{len(self._active_tasks)} deal logging task(s) still "
+                    f"running after {timeout:g}s"
+                )
+                return
+            logger.info(
+                f"Waiting for {len(self._active_tasks)} deal logging task(s)..."
+            )
+            await asyncio.wait(set(self._active_tasks), timeout=remaining)
 
     async def handle_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -68,7 +222,8 @@ class MessageHandler:
             logger.debug(f"Skipping: chat {chat_id} not in targets {self.target_group_ids}")
             return
 
-        should_process, reason = self._should_process_with_reason(message)
+        features = MessageFeatures.from_message(message)
+        should_process, reason = self._should_process_with_reason(message, features)
         if not should_process:
             logger.info(f"Message filtered: {reason}")
             return
@@ -174,7 +329,8 @@ class MessageHandler:
             logger.info(
                 f"No deals extracted "
                 f"(tokens: router={result.router_tokens}, "
-                f"extractor={result.extractor_tokens})"
+                f"extractor={result.extractor_tokens}, "
+                f"cache_read={result.cache_read_tokens})"
             )
             if result.needs_review:
                 reasons = "; ".join(result.review_reasons[:3])
@@ -186,46 +342,119 @@ class MessageHandler:
             result.router_confidence > 0 and result.router_confidence < 0.6
         )
 
-        # Create Notion entries for each extracted deal
-        created_deals = []
-        failed_deals = []
+        # Acknowledge now; Notion writes and the confirmation continue in the
+        # background, editing the placeholder when done
+        placeholder = await self._send_logging_placeholder(group, len(result.deals))
+        task = asyncio.create_task(
+            self._log_deals(
+                group, result, placeholder, combined_text, sender,
+                external_source, low_confidence,
+            )
+        )
+        self._active_tasks.add(task)
+        task.add_done_callback(self._active_tasks.discard)
 
-        for deal in result.deals:
-            try:
-                # Forward metadata is authoritative for forwarded messages;
-                # for non-forwarded messages, use LLM's per-deal extraction
-                if external_source:
-                    deal_external_source = external_source
-                else:
-                    deal_external_source = deal.external_source
-
-                # Scenario 5: Missing company name or tags (for Telegram report only)
-                missing_info = (
-                    deal.company_name == "Unknown" or not deal.tags
-                )
+    async def _log_deals(
+        self,
+        group: MessageGroup,
+        result,
+        placeholder,
+        combined_text: str,
+        sender: str,
+        external_source: Optional[str],
+        low_confidence: bool,
+    ) -> None:
+        """Create Notion entries for extracted deals and report back.
 
-                # Determine review status (Telegram report only, NOT written to Notion)
-                review_status = None
-                if low_confidence:
-                    review_status = "Low Confidence"
-                elif missing_info or result.needs_review:
-                    review_status = "Needs Review"
-
-                entry = DealEntry(
-                    title=deal.company_name,
-                    tags=deal.tags,
-                    intro=deal.intro,
-                    detailed_content=deal.detailed_content,
-                    op_source=sender,
-                    external_source=deal_external_source,
-                    deck_url=deal.deck_url,
-                    raise_amount=deal.raise_amount,
-                    valuation=deal.valuation,
-                )
+        Runs as a background task started by _process_group.
+
+        Args:
+            group: MessageGroup the deals came from.
+            result: ExtractionResult with at least one deal.
+            placeholder: "Logging..." message to edit into the confirmation.
+            combined_text: Combined text of the group's messages.
+            sender: Original message sender (OP Source).
+            external_source: Forward origin, if the group was forwarded.
+            low_confidence: Whether router confidence is low.
+        """
+        try:
+            await self._create_notion_entries(
+                group, result, placeholder, combined_text, sender,
+                external_source, low_confidence,
+            )
+        except Exception as e:
+            logger.exception(f"Error logging deals: {e}")
+            await self._delete_message(placeholder)
+            await self._send_error_notification(group, str(e))
+
+    async def _create_notion_entries(
+        self,
+        group: MessageGroup,
+        result,
+        placeholder,
+        combined_text: str,
+        sender: str,
+        external_source: Optional[str],
+        low_confidence: bool,
+    ) -> None:
+        """Body of _log_deals (see there for arguments)."""
+        # Original pitch text, added as a comment on every created page
+        pitch_comment = (
+            f"Original message from {sender}:\n\n{combined_text}"
+            if combined_text else None
+        )
+
+        # Create Notion entries for each extracted deal, concurrently
+        # (bounded by NOTION_CONCURRENCY; the Notion client is sync, so each
+        # call runs in a worker thread)
+        async def log_deal(deal) -> tuple[Optional[dict], Optional[dict]]:
+            async with self._notion_semaphore:
+                try:
+                    # Forward metadata is authoritative for forwarded messages;
+                    # for non-forwarded messages, use LLM's per-deal extraction
+                    if external_source:
+                        deal_external_source = external_source
+                    else:
+                        deal_external_source = deal.external_source
+
+                    # Scenario 5: Missing company name or tags (for Telegram report only)
+                    missing_info = (
+                        deal.company_name == "Unknown" or not deal.tags
+                    )
+
+                    # Determine review status (Telegram report only, NOT written to Notion)
+                    review_status = None
+                    if low_confidence:
+                        review_status = "Low Confidence"
+                    elif missing_info or result.needs_review:
+                        review_status = "Needs Review"
+
+                    entry = DealEntry(
+                        title=deal.company_name,
+                        tags=deal.tags,
+                        intro=deal.intro,
+                        detailed_content=deal.detailed_content,
+                        op_source=sender,
+                        external_source=deal_external_source,
+                        deck_url=deal.deck_url,
+                        raise_amount=deal.raise_amount,
+                        valuation=deal.valuation,
+                    )
+
+                    notion_result = await asyncio.to_thread(
+                        self.notion_client.create_deal_with_retry, entry
+                    )
 
-                notion_result = self.notion_client.create_deal_with_retry(entry)
+                    if not notion_result.success:
+                        logger.error(
+                            f"Failed to create Notion entry for {deal.company_name}: "
+                            f"{notion_result.error}"
+                        )
+                        return None, {
+                            "company_name": deal.company_name,
+                            "error": notion_result.error,
+                        }
 
-                if notion_result.success:
                     logger.info(
                         f"Created Notion entry: {deal.company_name} -> "
                         f"{notion_result.page_url}"
@@ -236,19 +465,19 @@ class MessageHandler:
                         try:
                             # Write intro as first comment (appears in Notion comments column)
                             if deal.intro:
-                                self.notion_client.add_comment(
-                                    notion_result.page_id, deal.intro
+                                await asyncio.to_thread(
+                                    self.notion_client.add_comment,
+                                    notion_result.page_id, deal.intro,
                                 )
                                 logger.info(
                                     f"Added intro as comment to {deal.company_name}"
                                 )
 
                             # Write original pitch text as second comment
-                            if combined_text:
-                                prefix = f"Original message from {sender}:\n\n"
-                                pitch_comment = f"{prefix}{combined_text}"
-                                comments_added = self.notion_client.add_comment_multipart(
-                                    notion_result.page_id, pitch_comment
+                            if pitch_comment:
+                                comments_added = await asyncio.to_thread(
+                                    self.notion_client.add_comment_multipart,
+                                    notion_result.page_id, pitch_comment,
                                 )
                                 if comments_added > 0:
                                     logger.info(
@@ -269,7 +498,7 @@ class MessageHandler:
                                 deal_deck_extracted = True
                                 break
 
-                    created_deals.append({
+                    return {
                         "company_name": deal.company_name,
                         "intro": deal.intro,
                         "tags": deal.tags,
@@ -281,42 +510,38 @@ class MessageHandler:
                         "status": review_status,
                         "raise_amount": deal.raise_amount,
                         "valuation": deal.valuation,
-                    })
-                else:
-                    logger.error(
-                        f"Failed to create Notion entry for {deal.company_name}: "
-                        f"{notion_result.error}"
+                    }, None
+
+                except Exception as e:
+                    logger.exception(
+                        f"Error creating Notion entry for {deal.company_name}: {e}"
                     )
-                    failed_deals.append({
+                    return None, {
                         "company_name": deal.company_name,
-                        "error": notion_result.error,
-                    })
+                        "error": str(e),
+                    }
 
-            except Exception as e:
-                logger.exception(
-                    f"Error creating Notion entry for {deal.company_name}: {e}"
-                )
-                failed_deals.append({
-                    "company_name": deal.company_name,
-                    "error": str(e),
-                })
+        # gather keeps result.deals order for the confirmation report
+        outcomes = await asyncio.gather(*(log_deal(deal) for deal in result.deals))
+        created_deals = [created for created, _ in outcomes if created]
+        failed_deals = [failed for _, failed in outcomes if failed]
 
-        # Send confirmation
+        # Send confirmation (Scenario 3: noting any deals that failed to log)
         if created_deals:
+            failed_names = [d["company_name"] for d in failed_deals]
             await self._send_confirmation(
-                group, created_deals, result, low_confidence
+                group, created_deals, result, low_confidence, placeholder,
+                failed_company_names=failed_names,
             )
 
-            # Scenario 3: Some decks failed to extract
-            if failed_deals:
-                failed_names = [d["company_name"] for d in failed_deals]
-                await self._send_partial_failure_warning(group, failed_names, result)
+        else:
+            await self._delete_message(placeholder)
 
-        elif failed_deals:
-            # Scenario 6: All Notion entries failed
-            await self._send_notion_failure_with_context(
-                group, failed_deals, combined_text, sender
-            )
+            if failed_deals:
+                # Scenario 6: All Notion entries failed
+                await self._send_notion_failure_with_context(
+                    group, failed_deals, combined_text, sender
+                )
 
     def _build_dedup_check(self):
         """Build an async dedup_check callback bound to the Notion client.
@@ -395,7 +620,7 @@ class MessageHandler:
         if not doc_message or not doc_message.document_name:
             return None
 
-        if not doc_message.document_name.lower().endswith(".pdf"):
+        if not doc_message.document_name.endswith(_PDF_SUFFIXES):
             return None
 
         try:
@@ -403,26 +628,21 @@ class MessageHandler:
             document = doc_message.message.document
             file = await self.bot.get_file(document.file_id)
 
-            # Generate unique path
-            import hashlib
-            file_hash = hashlib.md5(
-                f"{document.file_id}_{doc_message.message_id}".encode()
-            ).hexdigest()[:12]
-
-            pdf_path = self.temp_dir / "pdf_downloads" / f"{file_hash}.pdf"
-            pdf_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique extraction ID (12 hex chars; not security sensitive)
+            file_hash = hashlib.blake2b(
+                f"{document.file_id}_{doc_message.message_id}".encode(),
+                digest_size=6,
+            ).hexdigest()
 
-            await file.download_to_drive(pdf_path)
-            logger.info(f"Downloaded PDF: {doc_message.document_name} -> {pdf_path}")
+            data = await file.download_as_bytearray()
+            logger.info(
+                f"Downloaded PDF: {doc_message.document_name} ({len(data)} bytes)"
+            )
 
             # Extract text using DealExtractor's PDF extractor
-            result = self.deal_extractor.pdf_extractor.extract(pdf_path)
-
-            # Clean up downloaded file
-            try:
-                pdf_path.unlink()
-            except Exception:
-                pass
+            result = self.deal_extractor.pdf_extractor.extract_bytes(
+                data, doc_message.document_name, unique_id=file_hash
+            )
 
             if result.success and result.text_content:
                 logger.info(f"Extracted {len(result.text_content)} chars from PDF")
@@ -448,52 +668,25 @@ class MessageHandler:
         Returns:
             External source name or None.
         """
-        for msg in group.messages:
+        # Only forwarded messages carry a source; plain replies are skipped
+        for msg in group.get_forwarded_messages():
             telegram_msg = msg.message
 
-            # Check for forward_origin (python-telegram-bot v20+)
-            forward_origin = getattr(telegram_msg, 'forward_origin', None)
-            if forward_origin:
-                origin_type = getattr(forward_origin, 'type', None)
-
-                if origin_type == 'user':
-                    sender_user = getattr(forward_origin, 'sender_user', None)
-                    if sender_user:
-                        return sender_user.full_name or sender_user.username
-
-                elif origin_type == 'hidden_user':
-                    sender_name = getattr(forward_origin, 'sender_user_name', None)
-                    if sender_name:
-                        return sender_name
-
-                elif origin_type == 'chat':
-                    sender_chat = getattr(forward_origin, 'sender_chat', None)
-                    if sender_chat:
-                        return sender_chat.title
-
-                elif origin_type == 'channel':
-                    chat = getattr(forward_origin, 'chat', None)
-                    if chat:
-                        return chat.title
+            # Check for forward_origin (python-telegram-bot v20.8+)
+            if _HAS_FORWARD_ORIGIN and telegram_msg.forward_origin:
+                forward_origin = telegram_msg.forward_origin
+                get_source = _FORWARD_ORIGIN_SOURCES.get(forward_origin.type)
+                if get_source:
+                    source = get_source(forward_origin)
+                    if source:
+                        return source
 
             # Fallback: check legacy attributes
-            if hasattr(telegram_msg, 'forward_from') and telegram_msg.forward_from:
-                return (
-                    telegram_msg.forward_from.full_name
-                    or telegram_msg.forward_from.username
-                )
-
-            if (
-                hasattr(telegram_msg, 'forward_sender_name')
-                and telegram_msg.forward_sender_name
-            ):
-                return telegram_msg.forward_sender_name
-
-            if (
-                hasattr(telegram_msg, 'forward_from_chat')
-                and telegram_msg.forward_from_chat
-            ):
-                return telegram_msg.forward_from_chat.title
+            if _HAS_LEGACY_FORWARD:
+                for attr, get_source in _LEGACY_FORWARD_SOURCES:
+                    value = getattr(telegram_msg, attr)
+                    if value:
+                        return get_source(value)
 
         return None
 
@@ -516,12 +709,44 @@ class MessageHandler:
             logger.error(f"Failed to send processing notification: {e}")
             return None
 
+    async def _send_logging_placeholder(self, group: MessageGroup, deal_count: int):
+        """Reply with a "Logging N deal(s)..." message while Notion writes run.
+
+        Args:
+            group: The MessageGroup being processed.
+            deal_count: Number of deals being logged.
+
+        Returns:
+            The sent message object, or None.
+        """
+        if not group.messages:
+            return None
+
+        try:
+            first_msg = group.messages[0].message
+            return await first_msg.reply_text(f"Logging {deal_count} deal(s)...")
+        except Exception as e:
+            logger.error(f"Failed to send logging placeholder: {e}")
+            return None
+
+    @staticmethod
+    async def _delete_message(message) -> None:
+        """Delete a bot status message, if any, logging failures."""
+        if not message:
+            return
+        try:
+            await message.delete()
+        except Exception as e:
+            logger.warning(f"Failed to delete status message: {e}")
+
     async def _send_confirmation(
         self,
         group: MessageGroup,
         deals: list[dict],
         result,
         low_confidence: bool = False,
+        placeholder=None,
+        failed_company_names: Optional[list[str]] = None,
     ) -> None:
         """Send enhanced confirmation with pipeline details.
 
@@ -530,6 +755,10 @@ class MessageHandler:
             deals: List of created deal dicts.
             result: Full ExtractionResult.
             low_confidence: Whether router confidence is low.
+            placeholder: Optional "Logging..." message to edit into the
+                confirmation instead of sending a new reply.
+            failed_company_names: Deals from the same group that failed to
+                log, reported in the same message.
         """
         if not group.messages or not deals:
             return
@@ -546,10 +775,28 @@ class MessageHandler:
                     deals, result, low_confidence
                 )
 
+            if failed_company_names:
+                names_str = ", ".join(failed_company_names[:5])
+                if len(failed_company_names) > 5:
+                    names_str += f" (+{len(failed_company_names) - 5} more)"
+                confirmation += f"\n\n<b>Some deals failed to log:</b> {names_str}"
+
             # Cap at 4000 chars for Telegram limit
             if len(confirmation) > 4000:
                 confirmation = confirmation[:3997] + "..."
 
+            if placeholder:
+                try:
+                    await placeholder.edit_text(
+                        confirmation,
+                        parse_mode="HTML",
+                        disable_web_page_preview=True,
+                    )
+                    return
+                except Exception as e:
+                    logger.warning(f"Failed to edit logging placeholder: {e}")
+                    await self._delete_message(placeholder)
+
             await self._send_telegram_message_with_retry(
                 first_msg, confirmation, max_retries=3
             )
@@ -707,7 +954,10 @@ class MessageHandler:
         text: str,
         max_retries: int = 3,
     ) -> bool:
-        """Send a Telegram message with retry on timeout.
+        """Send a Telegram message with retry on timeout or flood control.
+
+        Timeouts back off exponentially; flood control (RetryAfter) waits as
+        long as Telegram asks.
 
         Args:
             message: Message to reply to.
@@ -717,8 +967,6 @@ class MessageHandler:
         Returns:
             True if sent successfully, False otherwise.
         """
-        import asyncio
-
         for attempt in range(max_retries):
             try:
                 await message.reply_text(
@@ -727,15 +975,29 @@ class MessageHandler:
                     disable_web_page_preview=True,
                 )
                 return True
+            except RetryAfter as e:
+                delay = e.retry_after
+                if isinstance(delay, timedelta):
+                    delay = delay.total_seconds()
+                logger.warning(
+                    f"Telegram flood control, retry in {delay}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Failed to send Telegram message: {e}")
+                return False
+            except TimedOut as e:
+                logger.warning(
+                    f"Telegram send timeout (attempt {attempt + 1}/{max_retries})"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                logger.error(f"Failed to send Telegram message: {e}")
+                return False
             except Exception as e:
-                error_str = str(e).lower()
-                if "timed out" in error_str or "timeout" in error_str:
-                    logger.warning(
-                        f"Telegram send timeout (attempt {attempt + 1}/{max_retries})"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
                 logger.error(f"Failed to send Telegram message: {e}")
                 return False
         return False
@@ -764,44 +1026,6 @@ class MessageHandler:
         except Exception as e:
             logger.error(f"Failed to send error notification: {e}")
 
-    async def _send_partial_failure_warning(
-        self,
-        group: MessageGroup,
-        failed_company_names: list[str],
-        result=None,
-    ) -> None:
-        """Send a warning about partially failed deal logging.
-
-        Args:
-            group: The MessageGroup being processed.
-            failed_company_names: List of company names that failed.
-            result: Optional ExtractionResult for deck failure details.
-        """
-        if not group.messages or not failed_company_names:
-            return
-
-        try:
-            first_msg = group.messages[0].message
-            names_str = ", ".join(failed_company_names[:5])
-            if len(failed_company_names) > 5:
-                names_str += f" (+{len(failed_company_names) - 5} more)"
-
-            lines = [f"<b>Some deals failed to log:</b> {names_str}"]
-
-            # Add deck failure details if available
-            if result and result.fetched_decks:
-                failed_decks = [d for d in result.fetched_decks if not d.success]
-                for deck in failed_decks[:3]:
-                    url_short = deck.url[:40] + "..." if len(deck.url) > 40 else deck.url
-                    lines.append(f"  Deck failed: {url_short} ({deck.error or 'unknown'})")
-
-            await first_msg.reply_text(
-                "\n".join(lines), parse_mode="HTML",
-                disable_web_page_preview=True,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send partial failure warning: {e}")
-
     async def _send_review_skipped_with_decks(
         self,
         group: MessageGroup,
@@ -944,11 +1168,14 @@ class MessageHandler:
         except Exception as e:
             logger.error(f"Failed to send needs-review notification: {e}")
 
-    def _should_process_with_reason(self, message: Message) -> tuple[bool, str]:
+    def _should_process_with_reason(
+        self, message: Message, features: MessageFeatures
+    ) -> tuple[bool, str]:
         """Determine if a message should be processed, with reason.
 
         Args:
             message: Telegram Message to check.
+            features: Precomputed MessageFeatures of message.
 
         Returns:
             Tuple of (should_process, reason).
@@ -957,9 +1184,9 @@ class MessageHandler:
         if message.from_user and message.from_user.is_bot:
             return False, "from bot"
 
-        has_text = bool(message.text or message.caption)
-        has_document = message.document is not None
-        has_photo = bool(message.photo)
+        has_text = bool(features.text)
+        has_document = features.has_document
+        has_photo = features.has_photo
 
         if not has_text and not has_document and not has_photo:
             return False, "no content"
@@ -967,101 +1194,47 @@ class MessageHandler:
         if has_document or has_photo:
             return True, "has attachment"
 
-        text = message.text or message.caption or ""
+        text_len = features.text_len
 
-        if len(text) < 5:
-            return False, f"too short ({len(text)} chars)"
+        if text_len < 5:
+            return False, f"too short ({text_len} chars)"
 
         # Accept forwarded messages
-        if hasattr(message, 'forward_origin') and message.forward_origin:
-            return True, "forwarded message"
-        if hasattr(message, 'forward_from') and message.forward_from:
-            return True, "forwarded message"
-        if hasattr(message, 'forward_sender_name') and message.forward_sender_name:
+        if features.is_forwarded:
             return True, "forwarded message"
 
-        if self._looks_like_deal(message):
+        if self._looks_like_deal(features):
             return True, "looks like deal"
 
         # Any message with a URL should go to Router for classification
-        if "http" in text.lower():
+        if "http" in features.text_lower:
             return True, "contains URL"
 
-        if len(text) >= 50:
+        if text_len >= 50:
             return True, "long message"
 
         return False, "no deal keywords found"
 
-    def _looks_like_deal(self, message: Message) -> bool:
+    def _looks_like_deal(self, features: MessageFeatures) -> bool:
         """Check if a message looks like a deal.
 
         Args:
-            message: Telegram Message to check.
+            features: Precomputed MessageFeatures of the message.
 
         Returns:
             True if the message might be a deal.
         """
-        if message.document:
-            file_name = message.document.file_name or ""
-            if file_name.lower().endswith(".pdf"):
+        if features.has_document:
+            if features.document_name.endswith(_PDF_SUFFIXES):
                 return True
 
-        text = (message.text or message.caption or "").lower()
-
-        deal_keywords = [
-            "docsend",
-            "pitch",
-            "deck",
-            "investment",
-            "funding",
-            "series",
-            "seed",
-            "pre-seed",
-            "raise",
-            "round",
-            "valuation",
-            "cap",
-            "safe",
-            "equity",
-            "tokenomics",
-            "whitepaper",
-            "intro",
-            "meet",
-            "connect",
-            "founder",
-            "startup",
-            "project",
-            "protocol",
-            "platform",
-        ]
-
-        for keyword in deal_keywords:
-            if keyword in text:
-                return True
-
-        url_patterns = [
-            "docsend.com",
-            "papermark.io",
-            "papermark.com",
-            ".pdf",
-            "notion.so",
-            "pitch.com",
-            "docs.google.com",
-            "loom.com",
-        ]
-
-        for pattern in url_patterns:
-            if pattern in text:
-                return True
+        text = features.text_lower
 
-        is_forwarded = (
-            (hasattr(message, 'forward_origin') and message.forward_origin)
-            or (hasattr(message, 'forward_from') and message.forward_from)
-            or (hasattr(message, 'forward_sender_name') and message.forward_sender_name)
-        )
+        if self._has_deal_pattern(text):
+            return True
 
-        if is_forwarded:
-            if len(text) >= 100:
+        if features.is_forwarded:
+            if features.text_len >= 100:
                 return True
             if "http" in text:
                 return True
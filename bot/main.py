@@ -52,6 +52,7 @@ class DealLoggingBot:
         self.config = config
         self.application = None
         self.deal_extractor = None
+        self.message_handler = None
         self._shutdown_event = None
         self._cleanup_task = None
 
@@ -107,30 +108,32 @@ class DealLoggingBot:
         )
 
         # Initialize message handler
-        message_handler = MessageHandler(
+        self.message_handler = MessageHandler(
             deal_extractor=self.deal_extractor,
             notion_client=notion_client,
             grouper=grouper,
             target_group_ids=self.config.telegram_group_ids,
             bot=self.application.bot,
-            temp_dir=self.config.temp_dir,
+            whole_word_keywords=self.config.whole_word_keywords,
         )
 
         # Register handlers
         self.application.add_handler(
             TelegramMessageHandler(
                 filters.ALL & ~filters.COMMAND,
-                message_handler.handle_message,
+                self.message_handler.handle_message,
             )
         )
 
         self.application.add_handler(
-            CallbackQueryHandler(message_handler.handle_callback_query)
+            CallbackQueryHandler(self.message_handler.handle_callback_query)
         )
 
         logger.info("Bot setup complete")
         logger.info(f"Monitoring Telegram group ID(s): {sorted(self.config.telegram_group_ids)}")
         logger.info(f"Message grouping timeout: {self.config.message_grouping_timeout}s")
+        if self.config.whole_word_keywords:
+            logger.info("Deal keywords: whole-word matching")
         logger.info(
             f"Cleanup: immediate={self.config.cleanup_after_extract}, "
             f"max_age={self.config.cleanup_max_age_minutes}min, "
@@ -174,6 +177,9 @@ class DealLoggingBot:
                 pass
 
         await self.application.updater.stop()
+        # Let in-flight Notion writes finish and edit their "Logging..."
+        # placeholders while the bot can still send messages
+        await self.message_handler.drain()
         await self.application.stop()
         await self.application.shutdown()
 
@@ -63,6 +63,8 @@ class BufferedMessage:
             hasattr(message, 'forward_from') and message.forward_from is not None
         ) or (
             hasattr(message, 'forward_sender_name') and message.forward_sender_name is not None
+        ) or (
+            hasattr(message, 'forward_from_chat') and message.forward_from_chat is not None
         )
 
         return cls(
@@ -106,6 +108,10 @@ class MessageGroup:
         """Check if any message in the group has a document."""
         return any(msg.has_document for msg in self.messages)
 
+    def get_forwarded_messages(self) -> list[BufferedMessage]:
+        """Get the forwarded messages in the group, in order."""
+        return [msg for msg in self.messages if msg.is_forwarded]
+
     def get_document_message(self) -> Optional[BufferedMessage]:
         """Get the first message with a document."""
         for msg in self.messages:
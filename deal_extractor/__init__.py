@@ -595,8 +595,7 @@ class DealExtractor:
 
                 # Save PDF
                 url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-                pdf_path = self.temp_dir / "pdf" / f"downloaded_{url_hash}.pdf"
-                pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                pdf_path = self.pdf_extractor.output_dir / f"downloaded_{url_hash}.pdf"
                 pdf_path.write_bytes(response.content)
 
             # Track for cleanup
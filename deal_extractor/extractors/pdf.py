@@ -5,8 +5,9 @@ import logging
 import subprocess
 import sys
 import uuid
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from ..models.types import FetchedDeck, PDFExtractionResult
 
@@ -79,6 +80,36 @@ class PDFExtractor:
         else:
             return self._extract_direct(pdf_path)
 
+    def extract_bytes(
+        self, data: bytes, name: str, unique_id: Optional[str] = None
+    ) -> PDFExtractionResult:
+        """Extract content from an in-memory PDF.
+
+        Direct extraction reads the bytes without touching disk. pdf2llm.py
+        runs as a subprocess and needs a file, so for that path the bytes are
+        written under output_dir and removed once extraction finishes.
+
+        Args:
+            data: PDF file contents.
+            name: Original file name (used for the fallback title).
+            unique_id: Optional unique identifier for parallel-safe processing.
+
+        Returns:
+            PDFExtractionResult with extraction details.
+        """
+        if not unique_id:
+            unique_id = uuid.uuid4().hex[:16]
+
+        if self.pdf2llm_path and self.pdf2llm_path.exists():
+            pdf_path = self.output_dir / f"upload_{unique_id}.pdf"
+            pdf_path.write_bytes(data)
+            try:
+                return self._extract_with_pdf2llm(pdf_path, unique_id)
+            finally:
+                pdf_path.unlink(missing_ok=True)
+
+        return self._extract_direct(Path(name), BytesIO(data))
+
     def _extract_with_pdf2llm(
         self, pdf_path: Path, unique_id: str
     ) -> PDFExtractionResult:
@@ -172,11 +203,15 @@ class PDFExtractor:
                 error=f"PDF extraction failed: {str(e)}",
             )
 
-    def _extract_direct(self, pdf_path: Path) -> PDFExtractionResult:
+    def _extract_direct(
+        self, pdf_path: Path, stream: Optional[BinaryIO] = None
+    ) -> PDFExtractionResult:
         """Extract text directly from PDF using pypdf.
 
         Args:
             pdf_path: Path to PDF file.
+            stream: Optional file object to read instead of pdf_path, which
+                then only provides the fallback title.
 
         Returns:
             PDFExtractionResult with extraction details.
@@ -184,7 +219,7 @@ class PDFExtractor:
         try:
             from pypdf import PdfReader
 
-            reader = PdfReader(str(pdf_path))
+            reader = PdfReader(stream if stream is not None else str(pdf_path))
             texts = []
 
             for page in reader.pages:
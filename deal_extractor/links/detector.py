@@ -6,6 +6,7 @@ This module has ZERO external dependencies - it only uses Python standard librar
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import parse_qs, unquote, urlparse
 
@@ -196,10 +197,9 @@ class LinkDetector:
             path = parsed.path.lower()
 
             # Check domain patterns
-            for link_type, patterns in self.DOMAIN_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, domain):
-                        return link_type
+            link_type = self._match_domain(domain)
+            if link_type is not None:
+                return link_type
 
             # Check for direct PDF links
             if path.endswith(".pdf"):
@@ -210,6 +210,32 @@ class LinkDetector:
         except Exception:
             return LinkType.UNKNOWN
 
+    def classify_urls(self, urls: list[str]) -> list[LinkType]:
+        """Classify several URLs in one call.
+
+        Equivalent to calling classify_url on each URL. Domain pattern
+        matching is cached per distinct domain, so links to the same hosts
+        repeated across a batch only pay for the regex scan once.
+
+        Args:
+            urls: URLs to classify.
+
+        Returns:
+            LinkType classification per URL, in input order.
+        """
+        classify_url = self.classify_url
+        return [classify_url(url) for url in urls]
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_domain(cls, domain: str) -> Optional[LinkType]:
+        """Return the first LinkType whose DOMAIN_PATTERNS match domain."""
+        for link_type, patterns in cls.DOMAIN_PATTERNS.items():
+            for pattern in patterns:
+                if re.search(pattern, domain):
+                    return link_type
+        return None
+
     def is_deck_link(self, url: str, link_type: LinkType) -> bool:
         """Determine if a link is likely a pitch deck.
 
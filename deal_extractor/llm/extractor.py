@@ -18,6 +18,21 @@ from .prompts import AVAILABLE_TAGS, EXTRACTOR_PROMPT, ROUTER_PROMPT
 logger = logging.getLogger(__name__)
 
 
+def _cached_prompt_tokens(usage) -> int:
+    """Prompt tokens the provider served from its prompt cache.
+
+    OpenAI reports these as usage.prompt_tokens_details.cached_tokens,
+    Moonshot (Kimi) as a top-level usage.cached_tokens.
+    """
+    if usage is None:
+        return 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details else None
+    if cached is None:
+        cached = getattr(usage, "cached_tokens", None)
+    return cached or 0
+
+
 class LLMExtractor:
     """Two-stage LLM extractor for efficient deal extraction.
 
@@ -134,7 +149,7 @@ class LLMExtractor:
                 )
             ]
 
-        deals, extractor_tokens = await self._run_extractor(
+        deals, extractor_tokens, cache_read_tokens = await self._run_extractor(
             message_text=message_text,
             sender=sender,
             fetched_decks=fetched_decks,
@@ -148,7 +163,8 @@ class LLMExtractor:
 
         logger.info(
             f"Extractor: {len(deals)} deals, "
-            f"tokens: router={router_tokens}, extractor={extractor_tokens}"
+            f"tokens: router={router_tokens}, extractor={extractor_tokens}, "
+            f"cache_read={cache_read_tokens}"
         )
 
         return ExtractionResult(
@@ -156,6 +172,7 @@ class LLMExtractor:
             deals=deals,
             router_tokens=router_tokens,
             extractor_tokens=extractor_tokens,
+            cache_read_tokens=cache_read_tokens,
             total_tokens=total_tokens,
             decks_fetched=decks_fetched,
             router_confidence=router_decision.confidence,
@@ -295,9 +312,13 @@ class LLMExtractor:
         sender: str,
         fetched_decks: list[FetchedDeck],
         company_hints: list[str],
-    ) -> tuple[list[Deal], int]:
+    ) -> tuple[list[Deal], int, int]:
         """Run the Extractor Agent (Stage 2).
 
+        The static EXTRACTOR_PROMPT goes first as the system message and all
+        per-message content last, so providers with automatic prefix caching
+        (OpenAI, Moonshot) can reuse the cached system prompt between calls.
+
         Args:
             message_text: The message content.
             sender: Message sender.
@@ -305,7 +326,7 @@ class LLMExtractor:
             company_hints: Company names from router.
 
         Returns:
-            Tuple of (list of Deal, tokens_used).
+            Tuple of (list of Deal, tokens_used, cached_prompt_tokens).
         """
         # Build prompt
         prompt_parts = [
@@ -332,6 +353,7 @@ class LLMExtractor:
 
         user_prompt = "\n".join(prompt_parts)
         tokens = 0
+        cached_tokens = 0
 
         try:
             # Build request kwargs
@@ -350,6 +372,7 @@ class LLMExtractor:
                 if response.usage
                 else 0
             )
+            cached_tokens = _cached_prompt_tokens(response.usage)
 
             content = response.choices[0].message.content or ""
             finish_reason = response.choices[0].finish_reason
@@ -376,14 +399,14 @@ class LLMExtractor:
                 )
                 deals.append(deal)
 
-            return deals, tokens
+            return deals, tokens, cached_tokens
 
         except json.JSONDecodeError as e:
             logger.error(f"Extractor JSON error: {e}")
-            return [], tokens
+            return [], tokens, cached_tokens
         except Exception as e:
             logger.exception(f"Extractor error: {e}")
-            return [], 0
+            return [], 0, 0
 
     def _extract_json(self, content: str) -> dict:
         """Extract JSON from LLM response.
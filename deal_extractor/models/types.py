@@ -56,6 +56,7 @@ class ExtractionResult:
     router_tokens: int = 0
     extractor_tokens: int = 0
     total_tokens: int = 0
+    cache_read_tokens: int = 0  # Extractor prompt tokens served from provider cache
 
     # Router details
     router_confidence: float = 0.0